@@ -20,7 +20,6 @@
 
 import dataclasses
 import functools
-import multiprocessing
 import pickle
 import random
 import sys
@@ -243,30 +242,25 @@ def main():
     # Solve GP problem
     only_visualize = False
     if not only_visualize:
-        with multiprocessing.Pool() as pool:
-            try:
-                toolbox.register("map", pool.map)
-
-                stats = deap.tools.Statistics(key=lambda code: code.fitness.values)
-                stats.register("avg", np.mean, axis=0)
-                stats.register("med", np.median, axis=0)
-                stats.register("min", np.min, axis=0)
-                pareto_front = deap.tools.ParetoFront()
-                population = toolbox.population(512)
-                population, logbook = solvers.gp.nsga2(
-                    population,
-                    toolbox,
-                    mu=512,
-                    lambda_=128,
-                    cxpb=0.5,
-                    mutpb=0.05,
-                    ngen=25,
-                    stats=stats,
-                    halloffame=pareto_front,
-                    verbose=True,
-                )
-            finally:
-                toolbox.register("map", map)
+        with solvers.gp.evaluation_workers(toolbox):
+            stats = deap.tools.Statistics(key=lambda code: code.fitness.values)
+            stats.register("avg", np.mean, axis=0)
+            stats.register("med", np.median, axis=0)
+            stats.register("min", np.min, axis=0)
+            pareto_front = deap.tools.ParetoFront()
+            population = toolbox.population(512)
+            population, logbook = solvers.gp.nsga2(
+                population,
+                toolbox,
+                mu=512,
+                lambda_=128,
+                cxpb=0.5,
+                mutpb=0.05,
+                ngen=25,
+                stats=stats,
+                halloffame=pareto_front,
+                verbose=True,
+            )
 
         with open("front.pkl", "wb") as f:
             pickle.dump(pareto_front, f)
@@ -20,6 +20,7 @@
 
 import dataclasses
 import functools
+import linecache
 from typing import Any, Dict, Iterable, Tuple, Union
 
 import sympy
@@ -61,8 +62,12 @@ class Algorithm:
         return outcome
 
     def to_function(self, parameters):
+        import ltitop.algorithms.expressions.arithmetic as arithmetic
+        import ltitop.arithmetic.symbolic as symbolic
+
         steps = []
-        variables = set()
+        slots = {}
+        variables = []
         arguments = list(self.inputs) + list(self.states)
         constants = dict(zip(self.parameters, parameters))
         for statement in self.procedure:
@@ -70,26 +75,29 @@ class Algorithm:
             for var, expression in change.items():
                 local_variables = [v for v in variables if expression.has(v)]
                 local_constants = [c for c in constants if expression.has(c)]
-                import ltitop.algorithms.expressions.arithmetic as arithmetic
-                import ltitop.arithmetic.symbolic as symbolic
-
-                func = functools.partial(
-                    sympy.lambdify(
-                        local_constants + arguments + local_variables,
-                        expression,
-                        modules=[symbolic, arithmetic, "numpy"],
-                    ),
-                    *[constants[c] for c in local_constants],
+                func = sympy.lambdify(
+                    local_constants + arguments + local_variables,
+                    expression,
+                    modules=[symbolic, arithmetic, "numpy"],
                 )
-                steps.append((var, func, local_variables))
-                if var not in self.states:
-                    variables.add(var)
+                # do not keep generated sources around
+                linecache.cache.pop(func.__code__.co_filename, None)
+                func = functools.partial(func, *[constants[c] for c in local_constants])
+                slot = slots.setdefault(var, len(slots))
+                steps.append((slot, func, tuple(slots[v] for v in local_variables)))
+                if var not in self.states and var not in variables:
+                    variables.append(var)
+        # index scope by position to avoid hashing
+        # symbolic expressions on every call
+        state_slots = tuple(slots[s] for s in self.states)
+        output_slots = tuple(slots[o] for o in self.outputs)
+        size = len(slots)
 
         def _function(inputs, states):
-            scope = {}
-            for var, func, args in steps:
-                scope[var] = func(*inputs, *states, *(scope[a] for a in args))
-            return ([scope[s] for s in self.states], [scope[o] for o in self.outputs])
+            scope = [None] * size
+            for slot, func, args in steps:
+                scope[slot] = func(*inputs, *states, *(scope[i] for i in args))
+            return ([scope[i] for i in state_slots], [scope[i] for i in output_slots])
 
         return _function
 
@@ -56,6 +56,10 @@ class FixedFormatArithmeticLogicUnit(ArithmeticLogicUnit):
     def represent(self, value, rtype=Representation):
         if isinstance(value, rtype) and value.format_ == self.format_:
             return value
+        return rtype(self._represent_mantissa(value), self.format_)
+
+    @functools.lru_cache(maxsize=128)
+    def _represent_mantissa(self, value):
         mantissa, (underflow, overflow) = self.format_.represent(
             value, rounding_method=nearest_integer
         )
@@ -75,6 +79,12 @@ class FixedFormatArithmeticLogicUnit(ArithmeticLogicUnit):
             mantissa, _ = self.overflow_behavior(
                 mantissa, range_=self.format_.mantissa_interval
             )
+        return mantissa
+
+    def represent_array(self, values, rtype=Representation):
+        mantissa = self._quantize_array(
+            values, self.format_, rounding_method=nearest_integer
+        )
         return rtype(mantissa, self.format_)
 
     @functools.lru_cache(maxsize=128)
@@ -85,9 +95,20 @@ class FixedFormatArithmeticLogicUnit(ArithmeticLogicUnit):
             max=self.format_.value_interval.upper_bound,
         )
 
+    def _check_operand(self, x):
+        if x.format_ != self.format_:
+            raise ValueError(f"{self} cannot handle {x}")
+
     @internals.operation_method
     def add(self, x, y):
-        mantissa = x.mantissa + y.mantissa
+        return self._add(x, y, y.mantissa)
+
+    def add_scalar(self, x, y):
+        self._check_operand(x)
+        return self._add(x, y, self._represent_mantissa(y))
+
+    def _add(self, x, y, mantissa_y):
+        mantissa = x.mantissa + mantissa_y
         if self.format_.overflows_with(mantissa):
             if not self.add.allows_overflow:
                 raise OverflowError(
@@ -102,7 +123,14 @@ class FixedFormatArithmeticLogicUnit(ArithmeticLogicUnit):
 
     @internals.operation_method
     def substract(self, x, y):
-        mantissa = x.mantissa - y.mantissa
+        return self._substract(x, y, y.mantissa)
+
+    def substract_scalar(self, x, y):
+        self._check_operand(x)
+        return self._substract(x, y, self._represent_mantissa(y))
+
+    def _substract(self, x, y, mantissa_y):
+        mantissa = x.mantissa - mantissa_y
         if self.format_.overflows_with(mantissa):
             if not self.substract.allows_overflow:
                 raise OverflowError(
@@ -117,9 +145,16 @@ class FixedFormatArithmeticLogicUnit(ArithmeticLogicUnit):
 
     @internals.operation_method
     def multiply(self, x, y):
+        return self._multiply(x, y, y.mantissa)
+
+    def multiply_scalar(self, x, y):
+        self._check_operand(x)
+        return self._multiply(x, y, self._represent_mantissa(y))
+
+    def _multiply(self, x, y, mantissa_y):
         # Use 2 * wordlength long multipliers
         z = Representation(
-            mantissa=x.mantissa * y.mantissa,
+            mantissa=x.mantissa * mantissa_y,
             format_=Format(
                 msb=self.format_.msb * 2 + 1,
                 lsb=self.format_.lsb * 2,
@@ -243,8 +278,7 @@ class FixedFormatArithmeticLogicUnit(ArithmeticLogicUnit):
         return x.mantissa - y.mantissa
 
     def lshift(self, x, n):
-        if x.format_ != self.format_:
-            raise ValueError(f"{self} cannot handle {x}")
+        self._check_operand(x)
         if n < 0:
             raise ValueError(f"negative shift count {n}")
         n = int(n)
@@ -262,8 +296,7 @@ class FixedFormatArithmeticLogicUnit(ArithmeticLogicUnit):
         return type(x)(mantissa, self.format_)
 
     def rshift(self, x, n):
-        if x.format_ != self.format_:
-            raise ValueError(f"{self} cannot handle {x}")
+        self._check_operand(x)
         if n < 0:
             raise ValueError(f"negative shift count {n}")
         n = int(n)
@@ -18,8 +18,11 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with ltitop.  If not, see <http://www.gnu.org/licenses/>.
 
+import dataclasses
 import functools
+import operator
 import re
+from typing import Callable
 
 import mpmath
 import numpy as np
@@ -36,6 +39,11 @@ class Format:
     lsb: int
     signed: bool = True
 
+    _integer_shift: int = dataclasses.field(init=False, repr=False, compare=False)
+    _integer_shift_operator: Callable = dataclasses.field(
+        init=False, repr=False, compare=False
+    )
+
     _qnotation_pattern = re.compile(r"^([su]?)Q([+-]?[0-9]+)\.([+-]?[0-9]+)$")
 
     @classmethod
@@ -144,6 +152,13 @@ class Format:
                 "Least significant bit (LSB) cannot be larger than"
                 f" most significant bit (MSB): {self.lsb} > {self.msb}"
             )
+        # Resolve mantissa to integer conversion ahead of time
+        if self.lsb < 0:
+            object.__setattr__(self, "_integer_shift", -self.lsb)
+            object.__setattr__(self, "_integer_shift_operator", operator.rshift)
+        else:
+            object.__setattr__(self, "_integer_shift", self.lsb)
+            object.__setattr__(self, "_integer_shift_operator", operator.lshift)
 
     @property  # type: ignore
     @functools.lru_cache(maxsize=128)
@@ -174,6 +189,21 @@ class Format:
                 )
             return interval(0, mpmath.ldexp(1, self.msb) - mpmath.ldexp(1, self.lsb))
 
+    @property  # type: ignore
+    @functools.lru_cache(maxsize=128)
+    def float_value_interval(self):
+        # Round bounds outwards so that range checks against
+        # this interval are conservative.
+        lower_bound = self.value_interval.lower_bound
+        float_lower_bound = float(lower_bound)
+        if float_lower_bound > lower_bound:
+            float_lower_bound = np.nextafter(float_lower_bound, -np.inf)
+        upper_bound = self.value_interval.upper_bound
+        float_upper_bound = float(upper_bound)
+        if float_upper_bound < upper_bound:
+            float_upper_bound = np.nextafter(float_upper_bound, np.inf)
+        return interval(float(float_lower_bound), float(float_upper_bound))
+
     @property  # type: ignore
     @functools.lru_cache(maxsize=128)
     def value_epsilon(self):
@@ -72,6 +72,17 @@ class MultiFormatArithmeticLogicUnit(ArithmeticLogicUnit):
             mantissa, format_ = Format.best(value, wordlength=self.wordlength)
         return rtype(mantissa, format_)
 
+    def represent_array(self, values, rtype=Representation, format_=None):
+        if format_ is None:
+            mantissa, format_ = Format.best(values, wordlength=self.wordlength)
+        else:
+            if format_.wordlength > self.wordlength:
+                raise ValueError(f"{format_} wordlength is too large")
+            mantissa = self._quantize_array(
+                values, format_, rounding_method=self.rounding_method
+            )
+        return rtype(mantissa, format_)
+
     @functools.lru_cache(maxsize=128)
     def rinfo(self, *, signed=True):
         if signed:
@@ -28,22 +28,28 @@ from ltitop.common.dataclasses import immutable_dataclass
 @immutable_dataclass
 class Number(Representation):
     @classmethod
-    def from_value(cls, *args, **kwargs):
+    def from_value(cls, value, *args, **kwargs):
         unit = ProcessingUnit.active()
-        return unit.represent(*args, rtype=cls, **kwargs)
+        if isinstance(value, np.ndarray):
+            return unit.represent_array(value, *args, rtype=cls, **kwargs)
+        return unit.represent(value, *args, rtype=cls, **kwargs)
 
     def __add__(self, other):
+        unit = ProcessingUnit.active()
+        if isinstance(other, (int, float)):
+            return unit.add_scalar(self, other)
         if not isinstance(other, Representation):
             other = Number.from_value(other)
-        unit = ProcessingUnit.active()
         return unit.add(self, other)
 
     __radd__ = __add__
 
     def __sub__(self, other):
+        unit = ProcessingUnit.active()
+        if isinstance(other, (int, float)):
+            return unit.substract_scalar(self, other)
         if not isinstance(other, Representation):
             other = Number.from_value(other)
-        unit = ProcessingUnit.active()
         return unit.substract(self, other)
 
     def __rsub__(self, other):
@@ -53,9 +59,11 @@ class Number(Representation):
         return unit.substract(other, self)
 
     def __mul__(self, other):
+        unit = ProcessingUnit.active()
+        if isinstance(other, (int, float)):
+            return unit.multiply_scalar(self, other)
         if not isinstance(other, Representation):
             other = Number.from_value(other)
-        unit = ProcessingUnit.active()
         return unit.multiply(self, other)
 
     __rmul__ = __mul__
@@ -112,7 +120,11 @@ class Number(Representation):
         if not self or not other:
             return not self and not other
         if not isinstance(other, Representation):
-            if other not in self.format_.value_interval:
+            if isinstance(other, (int, float)):
+                vi = self.format_.float_value_interval
+                if other < vi.lower_bound or other > vi.upper_bound:
+                    return False
+            elif other not in self.format_.value_interval:
                 return False
             other = Number.from_value(other)
         unit = ProcessingUnit.active()
@@ -123,22 +135,36 @@ class Number(Representation):
 
     def __lt__(self, other):
         if not isinstance(other, Representation):
-            vi = self.format_.value_interval
-            if np.any(other < vi.lower_bound):
-                return False
-            if np.any(other > vi.upper_bound):
-                return True
+            if isinstance(other, (int, float)):
+                vi = self.format_.float_value_interval
+                if other < vi.lower_bound:
+                    return False
+                if other > vi.upper_bound:
+                    return True
+            else:
+                vi = self.format_.value_interval
+                if np.any(other < vi.lower_bound):
+                    return False
+                if np.any(other > vi.upper_bound):
+                    return True
             other = Number.from_value(other)
         unit = ProcessingUnit.active()
         return bool(np.all(unit.compare(self, other) < 0))
 
     def __le__(self, other):
         if not isinstance(other, Representation):
-            vi = self.format_.value_interval
-            if np.any(other < vi.lower_bound):
-                return False
-            if np.any(other > vi.upper_bound):
-                return True
+            if isinstance(other, (int, float)):
+                vi = self.format_.float_value_interval
+                if other < vi.lower_bound:
+                    return False
+                if other > vi.upper_bound:
+                    return True
+            else:
+                vi = self.format_.value_interval
+                if np.any(other < vi.lower_bound):
+                    return False
+                if np.any(other > vi.upper_bound):
+                    return True
             other = Number.from_value(other)
         unit = ProcessingUnit.active()
         return bool(np.all(unit.compare(self, other) <= 0))
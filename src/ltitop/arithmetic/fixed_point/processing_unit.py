@@ -19,7 +19,9 @@
 # along with ltitop.  If not, see <http://www.gnu.org/licenses/>.
 
 import mpmath
+import numpy as np
 
+from ltitop.arithmetic.errors import OverflowError, UnderflowError
 from ltitop.arithmetic.modular import wraparound
 from ltitop.arithmetic.rounding import floor
 from ltitop.common.annotation import annotated_function
@@ -134,15 +136,69 @@ class ProcessingUnit(metaclass=Traceable):
     def represent(self, value, **kwargs):
         raise NotImplementedError()
 
+    def represent_array(self, values, **kwargs):
+        raise NotImplementedError()
+
+    def _quantize_array(self, values, format_, rounding_method):
+        values = np.asarray(values)
+        if not format_.signed and not np.all(values >= 0):
+            raise ValueError(f"Unsigned format cannot represent {values}")
+        mantissa = None
+        # Quantize in floating point if it is exact to do so
+        if (
+            values.dtype.kind == "f"
+            and abs(format_.lsb) < np.finfo(np.float64).maxexp // 2
+            and hasattr(rounding_method, "ufunc")
+        ):
+            values = values.astype(np.float64, copy=False)
+            if not np.all(np.isfinite(values)):
+                raise ValueError(f"Cannot quantize non-finite values: {values}")
+            scaled_values = rounding_method.ufunc(np.ldexp(values, -format_.lsb))
+            if np.all(np.abs(scaled_values) < 2 ** 62):
+                mantissa = scaled_values.astype(np.int64)
+                underflow = bool(np.any((mantissa == 0) & (values != 0)))
+                overflow = bool(
+                    np.any(
+                        (mantissa < format_.mantissa_interval.lower_bound)
+                        | (mantissa > format_.mantissa_interval.upper_bound)
+                    )
+                )
+        if mantissa is None:
+            mantissa, (underflow, overflow) = format_.represent(
+                values, rounding_method=rounding_method
+            )
+        if underflow and not self.represent.allows_underflow:
+            raise UnderflowError(
+                f"{values} underflows in {format_}", values, format_.value_epsilon
+            )
+        if overflow:
+            if not self.represent.allows_overflow:
+                raise OverflowError(
+                    f"{values} overflows in {format_}", values, format_.value_interval
+                )
+            mantissa, _ = self.overflow_behavior(
+                mantissa, range_=format_.mantissa_interval
+            )
+        return mantissa
+
     def add(self, x, y):
         return NotImplemented
 
+    def add_scalar(self, x, y):
+        return self.add(x, self.represent(y, rtype=type(x)))
+
     def substract(self, x, y):
         return NotImplemented
 
+    def substract_scalar(self, x, y):
+        return self.substract(x, self.represent(y, rtype=type(x)))
+
     def multiply(self, x, y):
         return NotImplemented
 
+    def multiply_scalar(self, x, y):
+        return self.multiply(x, self.represent(y, rtype=type(x)))
+
     def divide(self, x, y):
         return NotImplemented
 
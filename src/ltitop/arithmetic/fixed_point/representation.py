@@ -26,6 +26,7 @@ from numpy.typing import ArrayLike
 from ltitop.arithmetic.fixed_point.formats import Format
 from ltitop.arithmetic.floating_point import mpfloat
 from ltitop.arithmetic.interval import Interval
+from ltitop.common.arrays import ashashable
 from ltitop.common.dataclasses import immutable_dataclass
 
 
@@ -36,7 +37,7 @@ class Representation:
 
     def __post_init__(self):
         if __debug__:
-            if np.any(self.mantissa not in self.format_.mantissa_interval):
+            if self.mantissa not in self.format_.mantissa_interval:
                 raise ValueError(
                     f"{self.astype(float)} cannot be " f"represented in {self.format_}"
                 )
@@ -59,9 +60,8 @@ class Representation:
         return self.astype(mpfloat)
 
     def __int__(self):
-        if self.format_.lsb < 0:
-            return self.mantissa >> -self.format_.lsb
-        return self.mantissa << self.format_.lsb
+        format_ = self.format_
+        return format_._integer_shift_operator(self.mantissa, format_._integer_shift)
 
     __long__ = __int__
 
@@ -78,7 +78,4 @@ class Representation:
         return type(self)(self.mantissa[key], self.format_)
 
     def __hash__(self):
-        mantissa = self.mantissa
-        if hasattr(mantissa, "tobytes"):
-            mantissa = mantissa.tobytes()
-        return hash((mantissa, self.format_))
+        return hash((ashashable(self.mantissa), self.format_))
@@ -18,10 +18,14 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with ltitop.  If not, see <http://www.gnu.org/licenses/>.
 
+import dataclasses
+import numbers
 from typing import TYPE_CHECKING, Any, Optional
 
 import numpy as np
 
+from ltitop.common.arrays import ashashable
+
 if TYPE_CHECKING:
     from dataclasses import dataclass as immutable_dataclass
 else:
@@ -33,7 +37,12 @@ class Interval:
     lower_bound: Any
     upper_bound: Optional[Any] = None
 
+    _span_and_mask: Optional[Any] = dataclasses.field(
+        init=False, repr=False, compare=False
+    )
+
     def __post_init__(self):
+        super().__setattr__("_span_and_mask", None)
         if self.upper_bound is None:
             try:
                 if len(self.lower_bound) != 2:
@@ -43,12 +52,40 @@ class Interval:
             except TypeError:  # if len() fails
                 super().__setattr__("upper_bound", self.lower_bound)
         if __debug__:
-            if np.any(self.upper_bound < self.lower_bound):
+            if isinstance(self.lower_bound, np.ndarray) or isinstance(
+                self.upper_bound, np.ndarray
+            ):
+                invalid = np.any(self.upper_bound < self.lower_bound)
+            else:
+                invalid = self.upper_bound < self.lower_bound
+            if invalid:
                 raise ValueError(
                     f"Interval upper bound {self.upper_bound} cannot"
                     f" be lower than lower bound {self.lower_bound}"
                 )
 
+    def _get_span_and_mask(self):
+        if self._span_and_mask is None:
+            # Span of an integer range, and a bitmask for it
+            # if that span happens to be a power of two.
+            span = self.upper_bound + 1 - self.lower_bound
+            mask = None
+            if isinstance(span, numbers.Integral) and span > 0:
+                if not span & (span - 1):
+                    mask = span - 1
+            object.__setattr__(self, "_span_and_mask", (span, mask))
+        return self._span_and_mask
+
+    @property
+    def span(self):
+        span, _ = self._get_span_and_mask()
+        return span
+
+    @property
+    def mask(self):
+        _, mask = self._get_span_and_mask()
+        return mask
+
     def __abs__(self):
         lower_bound = np.max(
             [
@@ -96,17 +133,27 @@ class Interval:
         if isinstance(other, Interval):
             a = self.lower_bound * other.lower_bound
             b = self.lower_bound * other.upper_bound
+            lower_bound = np.minimum(a, b)
+            upper_bound = np.maximum(a, b)
             c = self.upper_bound * other.lower_bound
+            lower_bound = np.minimum(lower_bound, c)
+            upper_bound = np.maximum(upper_bound, c)
             d = self.upper_bound * other.upper_bound
-            return Interval(np.min([a, b, c, d], axis=0), np.max([a, b, c, d], axis=0))
+            lower_bound = np.minimum(lower_bound, d)
+            upper_bound = np.maximum(upper_bound, d)
+            return Interval(lower_bound, upper_bound)
         a = self.lower_bound * other
         b = self.upper_bound * other
-        return Interval(np.min([a, b], axis=0), np.max([a, b], axis=0))
+        if isinstance(other, numbers.Real):
+            return Interval(b, a) if other < 0 else Interval(a, b)
+        return Interval(np.minimum(a, b), np.maximum(a, b))
 
     def __rmul__(self, other):
         a = other * self.lower_bound
         b = other * self.upper_bound
-        return Interval(np.min([a, b], axis=0), np.max([a, b], axis=0))
+        if isinstance(other, numbers.Real):
+            return Interval(b, a) if other < 0 else Interval(a, b)
+        return Interval(np.minimum(a, b), np.maximum(a, b))
 
     def __div__(self, other):
         if isinstance(other, Interval):
@@ -224,13 +271,7 @@ class Interval:
         )
 
     def __hash_content__(self):
-        lower_bound = self.lower_bound
-        if hasattr(lower_bound, "tobytes"):
-            lower_bound = lower_bound.tobytes()
-        upper_bound = self.upper_bound
-        if hasattr(upper_bound, "tobytes"):
-            upper_bound = upper_bound.tobytes()
-        return (lower_bound, upper_bound)
+        return (ashashable(self.lower_bound), ashashable(self.upper_bound))
 
     def __hash__(self):
         return hash(self.__hash_content__())
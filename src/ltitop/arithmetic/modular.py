@@ -18,31 +18,52 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with ltitop.  If not, see <http://www.gnu.org/licenses/>.
 
+import numbers
+
 import numpy as np
 
 from ltitop.arithmetic.interval import Interval
-from ltitop.common.arrays import vectorize
 
 
-@vectorize(excluded=["range_"])
 def wraparound(value, range_):
-    if isinstance(value, Interval):
+    if type(value) is Interval:
         # TODO(hidmic): use modulo interval arithmetic?
-        lower_bound, lower_overflow = wraparound(value.lower_bound, range_=range_)
-        upper_bound, upper_overflow = wraparound(value.upper_bound, range_=range_)
-        overflow = np.logical_or(lower_overflow, upper_overflow)
+        lower_bound = value.lower_bound
+        upper_bound = value.upper_bound
+        # An interval overflows iff either bound is out of range,
+        # and an overflowing interval wraps around the whole range.
+        overflow = np.logical_or(
+            lower_bound < range_.lower_bound, upper_bound > range_.upper_bound
+        )
         if not np.isscalar(overflow):
             if np.any(overflow):
-                lower_bound[overflow] = range_.lower_bound
-                upper_bound[overflow] = range_.upper_bound
+                lower_bound = np.where(overflow, range_.lower_bound, lower_bound)
+                upper_bound = np.where(overflow, range_.upper_bound, upper_bound)
         elif overflow:
             lower_bound = range_.lower_bound
             upper_bound = range_.upper_bound
         return Interval(lower_bound, upper_bound), overflow
-    overflow = False
-    if value < range_.lower_bound or value > range_.upper_bound:
-        value = (value - range_.lower_bound) % (
-            range_.upper_bound + 1 - range_.lower_bound
-        ) + range_.lower_bound
-        overflow = True
-    return value, overflow
+    if isinstance(value, np.ndarray):
+        overflow = (value < range_.lower_bound) | (value > range_.upper_bound)
+        if np.any(overflow):
+            value = np.where(overflow, _wrap(value, range_), value)
+        return value, overflow
+    if range_.lower_bound <= value <= range_.upper_bound:
+        return value, False
+    return _wrap(value, range_), True
+
+
+def _wrap(value, range_):
+    lower_bound = range_.lower_bound
+    mask = range_.mask
+    if mask is not None and _is_integral(value):
+        # Power-of-two spans (e.g. fixed point mantissa
+        # ranges) wrap around by simply masking bits off.
+        return ((value - lower_bound) & mask) + lower_bound
+    return (value - lower_bound) % range_.span + lower_bound
+
+
+def _is_integral(value):
+    if isinstance(value, np.ndarray):
+        return value.dtype.kind in "iu"
+    return isinstance(value, numbers.Integral)
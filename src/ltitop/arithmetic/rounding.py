@@ -18,6 +18,7 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with ltitop.  If not, see <http://www.gnu.org/licenses/>.
 
+import functools
 import math
 
 import numpy as np
@@ -25,42 +26,68 @@ import numpy as np
 from ltitop.arithmetic.interval import Interval, interval
 
 
+def _power_of_two(exponent):
+    if type(exponent) is int and exponent >= 0:
+        return 1 << exponent
+    return 2 ** exponent
+
+
+def _shift_bounds(shift, value, n):
+    lower_bound = value.lower_bound
+    upper_bound = value.upper_bound
+    if isinstance(lower_bound, np.ndarray) or isinstance(upper_bound, np.ndarray):
+        # Shift both bounds in a single pass
+        bounds = shift(np.stack(np.broadcast_arrays(lower_bound, upper_bound)), n)
+        return Interval(lower_bound=bounds[0], upper_bound=bounds[1])
+    return Interval(
+        lower_bound=shift(lower_bound, n), upper_bound=shift(upper_bound, n)
+    )
+
+
 class nearest_integer:
+    ufunc = np.rint
+
     @staticmethod
     def apply(x):
         return round(x)
 
     @staticmethod
     def shift(value, n):
-        if isinstance(value, Interval):
-            return Interval(
-                lower_bound=nearest_integer.shift(value.lower_bound, n),
-                upper_bound=nearest_integer.shift(value.upper_bound, n),
-            )
+        if type(value) is Interval:
+            return _shift_bounds(nearest_integer.shift, value, n)
         result = floor.shift(value, n)
         if n < 0:
-            result += (value >> (-n - 1)) % 2
+            result += (value >> (-n - 1)) & 1
         return result
 
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def error_bounds(output_lsb, input_lsb=None):
         if input_lsb is None:
-            return interval(-(2 ** (output_lsb - 1)), 2 ** (output_lsb - 1))
+            return interval(
+                -_power_of_two(output_lsb - 1), _power_of_two(output_lsb - 1)
+            )
         return interval(
-            -(2 ** (output_lsb - 1)) + 2 ** input_lsb, 2 ** (output_lsb - 1)
+            -_power_of_two(output_lsb - 1) + _power_of_two(input_lsb),
+            _power_of_two(output_lsb - 1),
         )
 
 
 class floor:
+    ufunc = np.floor
+
     @staticmethod
     def apply(x):
+        if type(x) is float and x >= 0:
+            return int(x)
         return math.floor(x)
 
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def error_bounds(output_lsb, input_lsb=None):
         if input_lsb is None:
-            return interval(-(2 ** output_lsb), 0)
-        return interval(-(2 ** output_lsb) + 2 ** input_lsb, 0)
+            return interval(-_power_of_two(output_lsb), 0)
+        return interval(-_power_of_two(output_lsb) + _power_of_two(input_lsb), 0)
 
     @staticmethod
     def shift(value, n):
@@ -72,24 +99,35 @@ class floor:
 
 
 class ceil:
+    ufunc = np.ceil
+
     @staticmethod
     def apply(x):
+        if type(x) is float and x <= 0:
+            return int(x)
         return math.ceil(x)
 
     @staticmethod
     def shift(value, n):
+        if type(value) is Interval:
+            return _shift_bounds(ceil.shift, value, n)
         return -floor.shift(-value, n)
 
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def error_bounds(output_lsb, input_lsb=None):
         if input_lsb is None:
-            return interval(0, 2 ** output_lsb)
-        return interval(0, 2 ** output_lsb - 2 ** input_lsb)
+            return interval(0, _power_of_two(output_lsb))
+        return interval(0, _power_of_two(output_lsb) - _power_of_two(input_lsb))
 
 
 class truncate:
+    ufunc = np.trunc
+
     @staticmethod
     def apply(x):
+        if type(x) is float:
+            return int(x)
         try:
             return math.trunc(x)
         except TypeError:
@@ -97,17 +135,22 @@ class truncate:
 
     @staticmethod
     def shift(value, n):
-        if isinstance(value, Interval):
-            return Interval(
-                lower_bound=truncate.shift(value.lower_bound, n),
-                upper_bound=truncate.shift(value.upper_bound, n),
+        if type(value) is Interval:
+            return _shift_bounds(truncate.shift, value, n)
+        floor_result = floor.shift(value, n)
+        ceil_result = ceil.shift(value, n)
+        if isinstance(value, np.ndarray):
+            return np.where(
+                np.abs(floor_result) <= np.abs(ceil_result), floor_result, ceil_result
             )
-        results = np.array([floor.shift(value, n), ceil.shift(value, n)])
-        return results[np.argmin(np.abs(results), axis=0), np.arange(results.shape[1])]
+        if abs(floor_result) <= abs(ceil_result):
+            return floor_result
+        return ceil_result
 
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def error_bounds(output_lsb, input_lsb=None):
-        bounds = interval(-(2 ** output_lsb), 2 ** output_lsb)
+        bound = _power_of_two(output_lsb)
         if input_lsb is not None:
-            bounds += interval(2 ** input_lsb, -(2 ** input_lsb))
-        return bounds
+            bound -= _power_of_two(input_lsb)
+        return interval(-bound, bound)
@@ -21,15 +21,27 @@
 import numpy as np
 
 from ltitop.arithmetic.interval import Interval
-from ltitop.common.arrays import vectorize
 
 
-@vectorize(excluded=["range_"])
 def saturate(value, range_):
-    if isinstance(value, Interval):
-        lower_bound, lower_overflow = saturate(value.lower_bound, range_=range_)
-        upper_bound, upper_overflow = saturate(value.upper_bound, range_=range_)
-        overflow = np.logical_or(lower_overflow, upper_overflow)
+    if type(value) is Interval:
+        lower_bound, _ = saturate(value.lower_bound, range_=range_)
+        upper_bound, _ = saturate(value.upper_bound, range_=range_)
+        # An interval overflows iff either bound is out of range
+        overflow = np.logical_or(
+            value.lower_bound < range_.lower_bound,
+            value.upper_bound > range_.upper_bound,
+        )
         return Interval(lower_bound, upper_bound), overflow
-    overflow = value < range_.lower_bound or value > range_.upper_bound
-    return min(max(range_.lower_bound, value), range_.upper_bound), overflow
+    if isinstance(value, np.ndarray):
+        clipped_value = np.minimum(
+            np.maximum(value, range_.lower_bound), range_.upper_bound
+        )
+        return clipped_value, np.not_equal(clipped_value, value)
+    lower_bound = range_.lower_bound
+    if value < lower_bound:
+        return lower_bound, True
+    upper_bound = range_.upper_bound
+    if value > upper_bound:
+        return upper_bound, True
+    return value, False
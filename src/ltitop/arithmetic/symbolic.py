@@ -18,6 +18,7 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with ltitop.  If not, see <http://www.gnu.org/licenses/>.
 
+import functools
 import math
 
 import mpmath
@@ -25,13 +26,37 @@ from sympy.core.basic import Basic
 from sympy.core.decorators import _sympifyit, call_highest_priority
 from sympy.core.expr import AtomicExpr, Expr
 from sympy.core.function import Function
-from sympy.core.numbers import Number
+from sympy.core.numbers import Float, Integer, Number
 from sympy.core.parameters import global_parameters
 from sympy.core.singleton import S
 
 from ltitop.arithmetic.floating_point import mpfloat
 
 
+def _operator(reflected_name, native_numbers=False):
+    def _decorate(method):
+        generic_method = _sympifyit("other", NotImplemented)(
+            call_highest_priority(reflected_name)(method)
+        )
+
+        @functools.wraps(method)
+        def _wrapper(self, other):
+            # Operands of the same type or sympy numbers need neither
+            # sympification nor priority-based dispatch (the latter
+            # never take precedence over BaseNumber subclasses).
+            if type(other) is type(self) or isinstance(other, Number):
+                return method(self, other)
+            if type(other) is int:
+                return method(self, other if native_numbers else Integer(other))
+            if type(other) is float:
+                return method(self, other if native_numbers else Float(other))
+            return generic_method(self, other)
+
+        return _wrapper
+
+    return _decorate
+
+
 class BaseNumber(AtomicExpr):
     __slots__ = ()
 
@@ -92,10 +117,9 @@ class BaseNumber(AtomicExpr):
     def __getitem__(self, key):
         return type(self)(self._args[0][key])
 
-    @_sympifyit("other", NotImplemented)
-    @call_highest_priority("__radd__")
+    @_operator("__radd__", native_numbers=True)
     def __add__(self, other):
-        if isinstance(other, (BaseNumber, Number)) and global_parameters.evaluate:
+        if isinstance(other, _NUMERIC_TYPES) and global_parameters.evaluate:
             if other == S.Zero:
                 return self
             if not isinstance(other, type(self)):
@@ -103,10 +127,9 @@ class BaseNumber(AtomicExpr):
             return self._new(self._args[0] + other._args[0])
         return super().__add__(other)
 
-    @_sympifyit("other", NotImplemented)
-    @call_highest_priority("__add__")
+    @_operator("__add__", native_numbers=True)
     def __radd__(self, other):
-        if isinstance(other, (BaseNumber, Number)) and global_parameters.evaluate:
+        if isinstance(other, _NUMERIC_TYPES) and global_parameters.evaluate:
             if other == S.Zero:
                 return self
             if not isinstance(other, type(self)):
@@ -114,10 +137,9 @@ class BaseNumber(AtomicExpr):
             return self._new(other._args[0] + self._args[0])
         return super().__radd__(other)
 
-    @_sympifyit("other", NotImplemented)
-    @call_highest_priority("__rsub__")
+    @_operator("__rsub__", native_numbers=True)
     def __sub__(self, other):
-        if isinstance(other, (BaseNumber, Number)) and global_parameters.evaluate:
+        if isinstance(other, _NUMERIC_TYPES) and global_parameters.evaluate:
             if other == S.Zero:
                 return self
             if not isinstance(other, type(self)):
@@ -125,10 +147,9 @@ class BaseNumber(AtomicExpr):
             return self._new(self._args[0] - other._args[0])
         return super().__sub__(other)
 
-    @_sympifyit("other", NotImplemented)
-    @call_highest_priority("__sub__")
+    @_operator("__sub__", native_numbers=True)
     def __rsub__(self, other):
-        if isinstance(other, (BaseNumber, Number)) and global_parameters.evaluate:
+        if isinstance(other, _NUMERIC_TYPES) and global_parameters.evaluate:
             if other == S.Zero:
                 return self
             if not isinstance(other, type(self)):
@@ -139,10 +160,9 @@ class BaseNumber(AtomicExpr):
     def __neg__(self):
         return self._new(-self._args[0])
 
-    @_sympifyit("other", NotImplemented)
-    @call_highest_priority("__rmul__")
+    @_operator("__rmul__", native_numbers=True)
     def __mul__(self, other):
-        if isinstance(other, (BaseNumber, Number)) and global_parameters.evaluate:
+        if isinstance(other, _NUMERIC_TYPES) and global_parameters.evaluate:
             if other == S.One:
                 return self
             if other == -S.One:
@@ -152,10 +172,9 @@ class BaseNumber(AtomicExpr):
             return self._new(self._args[0] * other._args[0])
         return super().__mul__(other)
 
-    @_sympifyit("other", NotImplemented)
-    @call_highest_priority("__mul__")
+    @_operator("__mul__", native_numbers=True)
     def __rmul__(self, other):
-        if isinstance(other, (BaseNumber, Number)) and global_parameters.evaluate:
+        if isinstance(other, _NUMERIC_TYPES) and global_parameters.evaluate:
             if other == S.One:
                 return self
             if other == -S.One:
@@ -165,10 +184,9 @@ class BaseNumber(AtomicExpr):
             return self._new(self._args[0] * other._args[0])
         return super().__mul__(other)
 
-    @_sympifyit("other", NotImplemented)
-    @call_highest_priority("__rdiv__")
+    @_operator("__rdiv__", native_numbers=True)
     def __div__(self, other):
-        if isinstance(other, (BaseNumber, Number)) and global_parameters.evaluate:
+        if isinstance(other, _NUMERIC_TYPES) and global_parameters.evaluate:
             if other == S.One:
                 return self
             if other == -S.One:
@@ -180,19 +198,17 @@ class BaseNumber(AtomicExpr):
 
     __truediv__ = __div__
 
-    @_sympifyit("other", NotImplemented)
-    @call_highest_priority("__div__")
+    @_operator("__div__", native_numbers=True)
     def __rdiv__(self, other):
-        if isinstance(other, (BaseNumber, Number)) and global_parameters.evaluate:
+        if isinstance(other, _NUMERIC_TYPES) and global_parameters.evaluate:
             if not isinstance(other, type(self)):
                 other = type(self)(other)
             return self._new(other._args[0] / self._args[0])
         return super().__rdiv__(other)
 
-    @_sympifyit("other", NotImplemented)
-    @call_highest_priority("__rmod__")
+    @_operator("__rmod__", native_numbers=True)
     def __mod__(self, other):
-        if isinstance(other, (BaseNumber, Number)) and global_parameters.evaluate:
+        if isinstance(other, _NUMERIC_TYPES) and global_parameters.evaluate:
             if other == S.One:
                 return type(self)(0)
             if not isinstance(other, type(self)):
@@ -200,10 +216,9 @@ class BaseNumber(AtomicExpr):
             return self._new(self._args[0] % other._args[0])
         return super().__mod__(other)
 
-    @_sympifyit("other", NotImplemented)
-    @call_highest_priority("__mod__")
+    @_operator("__mod__", native_numbers=True)
     def __rmod__(self, other):
-        if isinstance(other, (BaseNumber, Number)) and global_parameters.evaluate:
+        if isinstance(other, _NUMERIC_TYPES) and global_parameters.evaluate:
             if not isinstance(other, type(self)):
                 other = type(self)(other)
             return self._new(other._args[0] % self._args[0])
@@ -212,8 +227,7 @@ class BaseNumber(AtomicExpr):
     def __hash__(self):
         return super().__hash__()
 
-    @_sympifyit("other", NotImplemented)
-    @call_highest_priority("__eq__")
+    @_operator("__eq__")
     def __eq__(self, other):
         if not other.is_Number:
             return False
@@ -228,8 +242,7 @@ class BaseNumber(AtomicExpr):
     def __ne__(self, other):
         return not (self == other)
 
-    @_sympifyit("other", NotImplemented)
-    @call_highest_priority("__lt__")
+    @_operator("__lt__")
     def __lt__(self, other):
         if not other.is_Number:
             return super().__lt__(other)
@@ -241,8 +254,7 @@ class BaseNumber(AtomicExpr):
             return self._args[0] < other
         return self._args[0] < mpfloat(other)
 
-    @_sympifyit("other", NotImplemented)
-    @call_highest_priority("__le__")
+    @_operator("__le__")
     def __le__(self, other):
         if not other.is_Number:
             return super().__le__(other)
@@ -267,6 +279,11 @@ class BaseNumber(AtomicExpr):
         return self._new(self._args[0] >> n)
 
 
+# plain Python numbers are wrapped by BaseNumber
+# subclasses just as well as their sympy counterparts
+_NUMERIC_TYPES = (BaseNumber, Number, int, float)
+
+
 class LoadExponent(Function):
     @classmethod
     def eval(cls, x, k):
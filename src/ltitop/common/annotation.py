@@ -21,27 +21,26 @@
 
 def annotated_function(func=None, **annotations):
     class _wrapper:
-        __slots__ = ("__func", "__annotations")
-
         def __init__(self, func):
             self.__func = func
-            self.__annotations = annotations
+            # Bind annotations as plain instance attributes,
+            # so that looking them up does not go through
+            # __getattr__.
+            vars(self).update(annotations)
 
         def __call__(self, *args, **kwargs):
             return self.__func(*args, **kwargs)
 
         def __getattr__(self, name):
-            if name in self.__annotations:
-                return self.__annotations[name]
             return getattr(self.__func, name)
 
         def annotate(self, *args, **kwargs):
             annotations = [(value.__name__, value) for value in args]
             annotations.extend(kwargs.items())
             for name, value in annotations:
-                if name in self.__annotations:
+                if name in vars(self):
                     raise ValueError(f"{name} already present")
-                self.__annotations[name] = value
+                setattr(self, name, value)
 
     if func is None:
         return _wrapper
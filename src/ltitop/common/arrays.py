@@ -19,6 +19,7 @@
 # along with ltitop.  If not, see <http://www.gnu.org/licenses/>.
 
 import functools
+import hashlib
 
 import numpy as np
 
@@ -27,8 +28,19 @@ def simple_if_possible(value, tol=1e-16, copy=False):
     if copy or np.isscalar(value):
         value = np.array(value)
     close_to_zero = np.abs(value) < tol
-    value[close_to_zero] = 0.0
-    if not np.all(np.isreal(value)):
+    if close_to_zero.any():
+        value[close_to_zero] = 0.0
+    if np.iscomplexobj(value):
+        # real and imaginary parts are views,
+        # writing to them writes to the array in place
+        real_part, imag_part = value.real, value.imag
+        close_to_real = np.abs(imag_part) < tol
+        if close_to_real.any():
+            imag_part[close_to_real] = 0.0
+        close_to_imag = np.abs(real_part) < tol
+        if close_to_imag.any():
+            real_part[close_to_imag] = 0.0
+    elif value.dtype.hasobject and not np.all(np.isreal(value)):
         close_to_real = np.abs(np.imag(value)) < tol
         value[close_to_real] = np.real(value[close_to_real])
         close_to_imag = np.abs(np.real(value)) < tol
@@ -43,6 +55,16 @@ def asscalar_if_possible(value):
     return value
 
 
+def ashashable(value):
+    if not isinstance(value, np.ndarray):
+        return value
+    if value.dtype.hasobject:
+        return value.tobytes()
+    # hash array buffer in place, no need for a bytes copy
+    digest = hashlib.blake2b(np.ascontiguousarray(value), digest_size=16).digest()
+    return (value.shape, value.dtype.str, digest)
+
+
 def asvector_if_possible(value):
     if np.ndim(value) == 2:
         if value.shape[0] == 1:
@@ -59,9 +81,14 @@ def vectorize(f=None, **kwargs):
         @functools.wraps(g)
         def __wrapper(*args, **kwargs):
             ret = h(*args, **kwargs)
-            if not isinstance(ret, tuple):
-                return asscalar_if_possible(ret)
-            return tuple(asscalar_if_possible(e) for e in ret)
+            if type(ret) is tuple:
+                return tuple(
+                    e.item() if isinstance(e, np.ndarray) and e.ndim == 0 else e
+                    for e in ret
+                )
+            if isinstance(ret, np.ndarray) and ret.ndim == 0:
+                return ret.item()
+            return ret
 
         return __wrapper
 
@@ -77,16 +104,37 @@ def empty_of(prototype, shape):
 
 
 def split(array, indices):
-    if len(indices) > 0:
-        yield array[: indices[0]]
-        if len(indices) > 1:
-            for start, end in zip(indices[0:-1], indices[1:]):
-                yield array[start:end]
-        yield array[indices[-1] :]
-    else:
-        yield array
+    if isinstance(array, np.ndarray):
+        return np.split(array, indices)
+    # sequences may be ragged, slice them as they are
+    bounds = [0, *indices, len(array)]
+    return [array[start:end] for start, end in zip(bounds[:-1], bounds[1:])]
 
 
-@vectorize(excluded="set_")
 def within(value, set_):
+    array = np.asarray(value)
+    if array.dtype.hasobject:
+        return _within(value, set_)
+    lower_bound = getattr(set_, "lower_bound", None)
+    upper_bound = getattr(set_, "upper_bound", None)
+    if (
+        lower_bound is not None
+        and upper_bound is not None
+        and np.ndim(lower_bound) == 0
+        and np.ndim(upper_bound) == 0
+    ):
+        # Interval-like sets, compare against bounds
+        result = np.logical_and(lower_bound <= array, array <= upper_bound)
+    elif isinstance(set_, (set, frozenset)) and array.dtype.kind in "biuf":
+        elements = np.array(list(set_))
+        if elements.ndim != 1 or elements.dtype.kind not in "biuf":
+            return _within(value, set_)
+        result = np.isin(array, elements, assume_unique=True)
+    else:
+        return _within(value, set_)
+    return result if array.ndim > 0 else bool(result)
+
+
+@vectorize(excluded={1, "set_"})
+def _within(value, set_):
     return value in set_
@@ -30,40 +30,81 @@ class Dataclass(Protocol):
     __dataclass_fields__: Dict
 
 
+def _getstate(self):
+    return {f.name: getattr(self, f.name) for f in dataclasses.fields(self)}
+
+
+def _setstate(self, state):
+    for name, value in state.items():
+        object.__setattr__(self, name, value)
+
+
+def _iterate(self):
+    for f in dataclasses.fields(self):
+        yield getattr(self, f.name)
+
+
+def _slots_of(cls):
+    slots = vars(cls).get("__slots__", ())
+    if isinstance(slots, str):
+        return (slots,)
+    return tuple(slots)
+
+
+def _rebind_closures(cls_dict, old_cls, new_cls):
+    # Point closures over the old class (e.g. those created
+    # by zero argument super() calls or by dataclasses) to
+    # the new class.
+    for value in cls_dict.values():
+        if isinstance(value, (classmethod, staticmethod)):
+            functions = [value.__func__]
+        elif isinstance(value, property):
+            functions = [value.fget, value.fset, value.fdel]
+        else:
+            functions = [value]
+        for function in functions:
+            while function is not None:
+                for cell in getattr(function, "__closure__", None) or ():
+                    try:
+                        if cell.cell_contents is old_cls:
+                            cell.cell_contents = new_cls
+                    except ValueError:  # empty cell
+                        pass
+                function = getattr(function, "__wrapped__", None)
+
+
 def immutable_dataclass(cls=None, iterable=False, **kwargs):
     def _decorate(cls):
         cls = dataclasses.dataclass(cls, frozen=True, **kwargs)
         cls_dict = dict(cls.__dict__)
-        field_names = tuple(f.name for f in dataclasses.fields(cls))
-        if hasattr(cls, "__slots__"):
-            field_names = [name for name in field_names if name not in cls.__slots__]
-        cls_dict["__slots__"] = field_names
+        slots = _slots_of(cls)
+        for name in slots:
+            cls_dict.pop(name, None)
+        inherited_slots = set()
+        for base in cls.__mro__[1:]:
+            inherited_slots.update(_slots_of(base))
+        field_names = tuple(
+            f.name
+            for f in dataclasses.fields(cls)
+            if f.name not in inherited_slots and f.name not in slots
+        )
+        cls_dict["__slots__"] = slots + field_names
         for field_name in field_names:
             cls_dict.pop(field_name, None)
-
-        def __getstate__(self):
-            return {f.name: getattr(self, f.name) for f in dataclasses.fields(self)}
-
-        cls_dict["__getstate__"] = __getstate__
-
-        def __setstate__(self, state):
-            for name, value in state.items():
-                object.__setattr__(self, name, value)
-
-        cls_dict["__setstate__"] = __setstate__
+        cls_dict["__getstate__"] = _getstate
+        cls_dict["__setstate__"] = _setstate
         if iterable and not hasattr(cls, "__iter__"):
-
-            def __iter__(self):
-                for f in dataclasses.fields(self):
-                    yield getattr(self, f.name)
-
-            cls_dict["__iter__"] = __iter__
+            cls_dict["__iter__"] = _iterate
         cls_dict.pop("__dict__", None)
+        cls_dict.pop("__weakref__", None)
         qualname = getattr(cls, "__qualname__", None)
-        cls = type(cls)(cls.__name__, (cls,) + cls.__bases__, cls_dict)
+        # Rebuild the class rather than deriving from it,
+        # so that instances do not get a __dict__.
+        new_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+        _rebind_closures(cls_dict, cls, new_cls)
         if qualname is not None:
-            cls.__qualname__ = qualname
-        return cls
+            new_cls.__qualname__ = qualname
+        return new_cls
 
     if cls is None:
         return _decorate
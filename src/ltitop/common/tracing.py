@@ -29,7 +29,7 @@ class Traceable(ABCMeta):
     def wrap_init(cls, init):
         def __init__(self, *args, **kwargs):
             init(self, *args, **kwargs)
-            self._traces = []
+            self._traces = ()
 
         return __init__
 
@@ -38,8 +38,11 @@ class Traceable(ABCMeta):
         @functools.wraps(method)
         def decorator(self, *args, **kwargs):
             ret = method(self, *args, **kwargs)
-            for trace in self._traces:
-                trace.append((decorator, ret, args, kwargs))
+            traces = self._traces
+            if traces:
+                record = (decorator, ret, args, kwargs)
+                for trace in traces:
+                    trace.append(record)
             return ret
 
         return decorator
@@ -49,16 +52,17 @@ class Traceable(ABCMeta):
         @contextlib.contextmanager
         def trace(self):
             trace = []
-            self._traces.append(trace)
+            traces = self._traces
+            self._traces = traces + (trace,)
             try:
                 yield trace
             finally:
-                self._traces.pop()
+                self._traces = traces
 
         @contextlib.contextmanager
         def notrace(self):
             traces = self._traces
-            self._traces = []
+            self._traces = ()
             try:
                 yield
             finally:
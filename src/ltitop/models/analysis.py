@@ -18,16 +18,84 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with ltitop.  If not, see <http://www.gnu.org/licenses/>.
 
+import collections
+import contextlib
 import functools
+import hashlib
 import math
+import os
+import tempfile
 import warnings
 
 import numpy as np
+import scipy.linalg
 import scipy.signal.ltisys as sys
 
 from ltitop.arithmetic.interval import Interval
 from ltitop.common.arrays import asscalar_if_possible
 
+_MODEL_ATTRIBUTES = {
+    sys.TransferFunctionDiscrete: ("num", "den"),
+    sys.ZerosPolesGainDiscrete: ("zeros", "poles", "gain"),
+    sys.StateSpaceDiscrete: ("A", "B", "C", "D"),
+}
+
+
+def _model_key(value):
+    # models are keyed on content, as ndarrays (and
+    # thus tuples of them) are unhashable and dlti instances only
+    # hash by identity
+    if isinstance(value, np.ndarray):
+        if value.dtype.hasobject:
+            # object buffers hold pointers, not values
+            return (value.dtype.str, value.shape) + tuple(
+                _model_key(item) for item in value.ravel().tolist()
+            )
+        return (value.dtype.str, value.shape, value.tobytes())
+    if isinstance(value, sys.dlti):
+        attributes = _MODEL_ATTRIBUTES.get(type(value))
+        if attributes is None:
+            raise TypeError(f"Cannot key {value}")
+        return (type(value), value.dt) + tuple(
+            _model_key(np.asarray(getattr(value, name))) for name in attributes
+        )
+    if isinstance(value, (tuple, list)):
+        return (type(value),) + tuple(_model_key(item) for item in value)
+    if isinstance(value, Interval):
+        return (
+            type(value),
+            _model_key(value.lower_bound),
+            _model_key(value.upper_bound),
+        )
+    hash(value)  # raise early if not hashable
+    return (type(value), value)
+
+
+def _memoize(maxsize):
+    def _decorator(func):
+        cache = collections.OrderedDict()
+
+        @functools.wraps(func)
+        def _wrapper(*args, **kwargs):
+            try:
+                key = _model_key(args) + _model_key(tuple(sorted(kwargs.items())))
+            except TypeError:
+                return func(*args, **kwargs)  # cannot memoize
+            try:
+                result = cache[key]
+            except KeyError:
+                result = cache[key] = func(*args, **kwargs)
+                if len(cache) > maxsize:
+                    cache.popitem(last=False)
+            else:
+                cache.move_to_end(key)
+            return result
+
+        _wrapper.cache_clear = cache.clear
+        return _wrapper
+
+    return _decorator
+
 
 def WCPG_ABCD(A, B, C, D, rel_tol=1e-6, nmax=10000):
     if not np.any(A @ A):
@@ -35,91 +103,265 @@ def WCPG_ABCD(A, B, C, D, rel_tol=1e-6, nmax=10000):
         return (
             np.absolute(D) + np.absolute(C @ B) + np.absolute(C @ A @ B)
         )  # series expansion
-    if np.any(np.abs(np.linalg.eigvals(A)) >= 1):
+    eigenvalues, eigenvectors = np.linalg.eig(A)
+    radii = np.abs(eigenvalues)
+    if np.any(radii >= 1):
         raise ValueError(
             f"System matrix {A} has eigenvalues" " larger than 1, output diverges"
         )
-    # TODO(hidmic): do better than brute force
-    WCPG = D
-    Ap = np.eye(A.shape[0])
-    WCPG_terms = np.zeros_like(D)
-    for n in range(math.ceil(nmax / 100)):
-        WCPG_terms[:] = 0.0
-        for _ in range(n * 100, (n + 1) * 100):
-            WCPG_terms += np.abs(C @ Ap @ B)
-            Ap = Ap @ A
-        WCPG += WCPG_terms
-        if np.all((WCPG_terms / WCPG) <= rel_tol):
+    tail_bound = None
+    # bounds are only reliable for well conditioned
+    # eigenvector bases (i.e. far from defective system matrices)
+    if np.linalg.cond(eigenvectors) < 1 / np.sqrt(np.finfo(np.float64).eps):
+        # With A = V L V^-1, C A^n B = (C V) L^n (V^-1 B) and the
+        # tail of the series after n terms is bounded by
+        # sum_k |C V|_k |l_k|^n / (1 - |l_k|) |V^-1 B|_k
+        CV = np.abs(C @ eigenvectors)
+        VinvB = np.abs(np.linalg.solve(eigenvectors, B))
+
+        def tail_bound(n):
+            return (CV * (radii ** n / (1 - radii))) @ VinvB
+
+    # Sum |C A^n B| in blocks of k terms, computing C A^i for i < k
+    # once and then propagating A^(jk) B from one block to the next
+    block_size = min(64, nmax)
+    Ai = np.empty((block_size,) + A.shape)
+    Ai[0] = np.eye(A.shape[0])
+    for i in range(1, block_size):
+        np.matmul(Ai[i - 1], A, out=Ai[i])
+    Ak = Ai[-1] @ A
+    CAi = C @ Ai
+    num_blocks = -(-nmax // block_size)
+    WCPG_terms = np.empty((num_blocks * block_size + 1,) + D.shape)
+    np.absolute(D, out=WCPG_terms[0])
+    WCPG = WCPG_terms[0].copy()
+    block_WCPG = np.empty_like(WCPG)
+    AjkB = B.astype(np.float64)
+    next_AjkB = np.empty_like(AjkB)
+    for n in range(block_size, nmax + block_size, block_size):
+        block_terms = WCPG_terms[n - block_size + 1 : n + 1]
+        np.matmul(CAi, AjkB, out=block_terms)
+        np.absolute(block_terms, out=block_terms)
+        np.sum(block_terms, axis=0, out=block_WCPG)
+        WCPG += block_WCPG
+        if tail_bound is not None:
+            # terms are cheap, go for full precision
+            if np.all(tail_bound(n) <= np.finfo(np.float64).eps * WCPG):
+                break
+        elif np.all((block_WCPG / WCPG) <= rel_tol):
             break  # early
+        np.matmul(Ak, AjkB, out=next_AjkB)
+        AjkB, next_AjkB = next_AjkB, AjkB
     else:
+        if tail_bound is None or not np.all(tail_bound(n) <= rel_tol * WCPG):
+            warnings.warn(
+                (
+                    f"Could not achieve required tolerance ({rel_tol}) "
+                    "in worst case peak gain computation after summing "
+                    f"{n} terms"
+                ),
+                RuntimeWarning,
+                stacklevel=2,
+            )
+    # Sum all terms again but with a single rounding
+    WCPG_terms = WCPG_terms[: n + 1]
+    for index in np.ndindex(*WCPG.shape):
+        WCPG[index] = math.fsum(WCPG_terms[(slice(None),) + index])
+    return WCPG
+
+
+# bump on changes to WCPG_ABCD results or their on-disk layout
+_WCPG_CACHE_VERSION = 1
+
+
+def _persistently_cached_WCPG_ABCD(A, B, C, D):
+    # the same blocks recur across optimizer runs,
+    # keep results on disk if a cache directory was provided
+    cache_dir = os.environ.get("LTITOP_WCPG_CACHE_DIR")
+    if not cache_dir:
+        return WCPG_ABCD(A, B, C, D)
+    digest = hashlib.sha256(f"v{_WCPG_CACHE_VERSION}".encode())
+    for matrix in (A, B, C, D):
+        digest.update(repr((matrix.dtype.str, matrix.shape)).encode())
+        digest.update(np.ascontiguousarray(matrix).tobytes())
+    cache_path = os.path.join(cache_dir, digest.hexdigest() + ".npy")
+    try:
+        return np.load(cache_path, allow_pickle=False)
+    except (OSError, ValueError):
+        pass
+    WCPG = WCPG_ABCD(A, B, C, D)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=cache_dir, suffix=".npy")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.save(f, WCPG, allow_pickle=False)
+            os.replace(temp_path, cache_path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(temp_path)
+            raise
+    except OSError as e:
         warnings.warn(
-            (
-                f"Could not achieve required tolerance ({rel_tol}) "
-                "in worst case peak gain computation after summing "
-                f"~{nmax * 100} terms"
-            ),
-            RuntimeWarning,
+            f"Could not cache worst case peak gain: {e}", RuntimeWarning, stacklevel=2
         )
     return WCPG
 
 
-@functools.lru_cache(maxsize=256)
+def _poles_from_model(model):
+    # avoid ZPK conversions (and dlti instantiation),
+    # only poles are needed
+    if isinstance(model, sys.ZerosPolesGainDiscrete):
+        return model.poles
+    if isinstance(model, sys.TransferFunctionDiscrete):
+        return np.roots(model.den)
+    if isinstance(model, sys.StateSpaceDiscrete):
+        A = model.A
+    elif len(model) == 2:  # (num, den)
+        return np.roots(np.atleast_1d(np.squeeze(model[1])))
+    elif len(model) == 3:  # (zeros, poles, gain)
+        return np.atleast_1d(model[1])
+    elif len(model) == 4:  # (A, B, C, D)
+        A = np.atleast_2d(model[0])
+    else:
+        return sys.dlti(*model).poles
+    if A.size == 0:
+        return np.array([])
+    return scipy.linalg.eigvals(A, check_finite=False)
+
+
+@_memoize(maxsize=256)
+def _pole_radii(model):
+    return np.sort(np.absolute(_poles_from_model(model)))
+
+
+def _schur_cohn_test(den, radius=1.0):
+    # Step-down recursion on reflection coefficients, all of which have
+    # to lie within the unit circle for den roots to lie within radius
+    a = np.trim_zeros(np.atleast_1d(np.asarray(den)), "f")
+    if a.size == 0:
+        raise ValueError("Denominator cannot be zero")
+    if radius != 1.0:
+        a = a / radius ** np.arange(a.size)
+    a = a / a[0]
+    while a.size > 1:
+        k = a[-1]
+        if np.absolute(k) >= 1:
+            return False
+        a = (a - k * np.conj(a[::-1]))[:-1] / (1 - np.absolute(k) ** 2)
+    return True
+
+
+def _denominator_if_transfer_function(model):
+    if isinstance(model, sys.TransferFunctionDiscrete):
+        return model.den
+    if isinstance(model, tuple) and len(model) == 2:
+        den = np.asarray(model[1])
+        if den.ndim == 1:
+            return den
+    return None
+
+
 def is_stable(model, tol=1e-16):
-    if not isinstance(model, sys.dlti):
-        model = sys.dlti(*model)
-    return np.all(np.absolute(model.poles) < (1.0 - tol))
+    den = _denominator_if_transfer_function(model)
+    if den is not None:
+        return _schur_cohn_test(den, 1.0 - tol)
+    radii = _pole_radii(model)
+    return radii.size == 0 or radii[-1] < (1.0 - tol)
 
 
-@functools.lru_cache(maxsize=256)
 def spectral_radius(model):
-    if not isinstance(model, sys.dlti):
-        model = sys.dlti(*model)
-    poles = model.poles
-    if poles.size == 0:
+    radii = _pole_radii(model)
+    if radii.size == 0:
         return None
-    return np.max(np.absolute(poles))
+    return radii[-1]
 
 
-@functools.lru_cache(maxsize=256)
+@_memoize(maxsize=256)
+@functools.singledispatch
 def dc_gain(model):
-    if not isinstance(model, sys.dlti):
-        model = sys.dlti(*model)
-    if isinstance(model, sys.ZerosPolesGainDiscrete):
-        model = model.to_tf()
-    if isinstance(model, sys.TransferFunctionDiscrete):
-        if model.outputs != 1:
-            raise NotImplementedError("SISO transfer functions only")
-        return np.sum(model.num) / np.sum(model.den)
-    if isinstance(model, sys.StateSpaceDiscrete):
-        return (
-            model.C @ np.linalg.inv(np.eye(*model.A.shape) - model.A) @ model.B
-            + model.D
-        )
     raise TypeError(f"Cannot compute DC gain of {model}")
 
 
-@functools.lru_cache(maxsize=256)
-def worst_case_peak_gain(model):
-    if not isinstance(model, sys.dlti):
-        model = sys.dlti(*model)
-    if isinstance(model, sys.StateSpaceDiscrete):
-        return WCPG_ABCD(
-            model.A.astype(np.float64),
-            model.B.astype(np.float64),
-            model.C.astype(np.float64),
-            model.D.astype(np.float64),
-        )
-    if isinstance(model, sys.TransferFunctionDiscrete):
-        if model.outputs != 1:
+@dc_gain.register(tuple)
+def _(model):
+    if len(model) == 2:  # (num, den)
+        num, den = model
+        if np.ndim(num) > 1 and np.shape(num)[0] != 1:
             raise NotImplementedError("SISO transfer functions only")
-        return worst_case_peak_gain(model.to_ss())[0, 0]
+        return np.sum(num) / np.sum(den)
+    if len(model) == 4:  # (A, B, C, D)
+        return _state_space_dc_gain(*sys.abcd_normalize(*model))
+    return dc_gain(sys.dlti(*model))
+
+
+@dc_gain.register(sys.TransferFunctionDiscrete)
+def _(model):
+    if model.outputs != 1:
+        raise NotImplementedError("SISO transfer functions only")
+    return np.sum(model.num) / np.sum(model.den)
+
+
+@dc_gain.register(sys.ZerosPolesGainDiscrete)
+def _(model):
+    return dc_gain(model.to_tf())
+
+
+@dc_gain.register(sys.StateSpaceDiscrete)
+def _(model):
+    return _state_space_dc_gain(model.A, model.B, model.C, model.D)
+
+
+def _state_space_dc_gain(A, B, C, D):
+    if A.size == 0:
+        return D
+    I_A = np.eye(A.shape[0]) - A
+    return C @ scipy.linalg.solve(I_A, B, check_finite=False, assume_a="gen") + D
+
+
+@_memoize(maxsize=256)
+@functools.singledispatch
+def worst_case_peak_gain(model):
     raise TypeError(f"Cannot compute worst case peak gain of {model}")
 
 
+@worst_case_peak_gain.register(tuple)
+def _(model):
+    if len(model) == 2:  # (num, den)
+        A, B, C, D = sys.tf2ss(*model)
+        if C.shape[0] != 1:
+            raise NotImplementedError("SISO transfer functions only")
+        return _state_space_worst_case_peak_gain(A, B, C, D)[0, 0]
+    if len(model) == 4:  # (A, B, C, D)
+        return _state_space_worst_case_peak_gain(*sys.abcd_normalize(*model))
+    return worst_case_peak_gain(sys.dlti(*model))
+
+
+@worst_case_peak_gain.register(sys.TransferFunctionDiscrete)
+def _(model):
+    if model.outputs != 1:
+        raise NotImplementedError("SISO transfer functions only")
+    return worst_case_peak_gain(model.to_ss())[0, 0]
+
+
+@worst_case_peak_gain.register(sys.StateSpaceDiscrete)
+def _(model):
+    return _state_space_worst_case_peak_gain(model.A, model.B, model.C, model.D)
+
+
+def _state_space_worst_case_peak_gain(A, B, C, D):
+    return _persistently_cached_WCPG_ABCD(
+        A.astype(np.float64),
+        B.astype(np.float64),
+        C.astype(np.float64),
+        D.astype(np.float64),
+    )
+
+
 wcpg = worst_case_peak_gain
 
 
-@functools.lru_cache(maxsize=128)
+@_memoize(maxsize=128)
 def output_range(model, input_range):
     if not isinstance(model, sys.dlti):
         model = sys.dlti(*model)
@@ -132,10 +374,19 @@ def output_range(model, input_range):
 
     if model.inputs > 1:
         mean_output = dc_gain(model) @ mean_input
-        output_delta = worst_case_peak_gain(model) @ input_delta
     else:
         mean_output = dc_gain(model) * mean_input
-        output_delta = worst_case_peak_gain(model) * input_delta
+
+    if np.any(input_delta != 0):
+        if model.inputs > 1:
+            output_delta = worst_case_peak_gain(model) @ input_delta
+        else:
+            output_delta = worst_case_peak_gain(model) * input_delta
+    else:
+        # worst_case_peak_gain() would otherwise reject unstable models
+        if not is_stable(model):
+            raise ValueError("Model has poles outside the unit circle, output diverges")
+        output_delta = np.zeros_like(mean_output)
 
     if model.outputs == 1:
         mean_output = asscalar_if_possible(mean_output)
@@ -144,4 +395,4 @@ def output_range(model, input_range):
     a = mean_output - output_delta
     b = mean_output + output_delta
 
-    return Interval(np.min([a, b], axis=0), np.max([a, b], axis=0))
+    return Interval(np.minimum(a, b), np.maximum(a, b))
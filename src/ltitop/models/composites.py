@@ -25,21 +25,25 @@ import scipy.signal as signal
 
 import ltitop.algebra.polynomials as poly
 import ltitop.algebra.rational_functions as rf
+from ltitop.models.transforms import as_zpk
+
+ZerosPolesGainContinuous = signal.ltisys.ZerosPolesGainContinuous
+ZerosPolesGainDiscrete = signal.ltisys.ZerosPolesGainDiscrete
 
 
 def model_decomposition(operator):
     @functools.wraps(operator)
     def __wrapper(model, *args, **kwargs):
-        model = model._as_zpk()
+        model = as_zpk(model)
         decomposition = operator(
             model.zeros, model.poles, model.gain, *args, dt=model.dt, **kwargs
         )
         kwargs = {}
         if model.dt is not None:
-            cls = signal.ltisys.ZerosPolesGainDiscrete
+            cls = ZerosPolesGainDiscrete
             kwargs["dt"] = model.dt
         else:
-            cls = signal.ltisys.ZerosPolesGainContinuous
+            cls = ZerosPolesGainContinuous
         return [cls(*args, **kwargs) for args in decomposition]
 
     return __wrapper
@@ -54,14 +58,14 @@ def model_composition(operator):
                 "Cannot mix continuous models with discrete models nor"
                 " discrete models with different sampling frequencies"
             )
-        models = [model._as_zpk() for model in models]
+        models = [as_zpk(model) for model in models]
         args = operator([(model.zeros, model.poles, model.gain) for model in models])
         kwargs = {}
         if dt is not None:
-            cls = signal.ltisys.ZerosPolesGainDiscrete
+            cls = ZerosPolesGainDiscrete
             kwargs["dt"] = dt
         else:
-            cls = signal.ltisys.ZerosPolesGainContinuous
+            cls = ZerosPolesGainContinuous
         return cls(*args, **kwargs)
 
     return __wrapper
@@ -87,23 +91,27 @@ def _simplify_continuous_time_model(z, p, k, tol=1e-16):
     wo = np.abs(np.imag(p_max))
     wo += np.abs(np.real(p_max))
     zo = 1j * wo
-    ez = np.array([zo, -zo])
-    z = np.ma.array(z, mask=np.zeros_like(z))
+    wz = np.imag(z)
+    # NOTE(hidmic): what about phase changes?
+    ez = np.where(
+        (np.abs(wz) <= wo)[:, np.newaxis],
+        np.stack([1j * wz, -zo * np.copysign(1, wz)], axis=-1),
+        np.array([zo, -zo]),
+    )
+    # Evaluate all zero and pole factors at once, only
+    # zero removal decisions need to be taken in order
+    zfactors = ez[:, :, np.newaxis] - z
+    pfactors = np.prod(ez[:, :, np.newaxis] - p, axis=-1)
+    deltas = np.abs(ez - z[:, np.newaxis]) - np.abs(z)[:, np.newaxis]
+    mask = np.ones(len(z), dtype=bool)
     for i in range(len(z)):
-        ezi = ez
-        zi = z[i]
-        wi = np.imag(zi)
-        if np.abs(wi) <= wo:
-            ezi = np.array([1j * wi, -zo * np.copysign(1, wi)])
-        # NOTE(hidmic): what about phase changes?
-        z.mask[i] = True
-        zm = z if not np.all(z.mask) else np.array([])
-        error = (np.abs(ezi - zi) - np.abs(zi)) * np.abs(rf.evaluate(zm, p, k, ezi))
-        if np.all(error < tol):
-            k *= np.abs(zi)
+        mask[i] = False
+        value = k * np.prod(zfactors[i][:, mask], axis=-1) / pfactors[i]
+        if np.all(deltas[i] * np.abs(value) < tol):
+            k *= np.abs(z[i])
         else:
-            z.mask[i] = False
-    return z.compressed(), p, k
+            mask[i] = True
+    return z[mask], p, k
 
 
 def _simplify_discrete_time_model(z, p, k, tol=1e-16):
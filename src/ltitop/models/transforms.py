@@ -19,6 +19,7 @@
 # along with ltitop.  If not, see <http://www.gnu.org/licenses/>.
 
 import functools
+import weakref
 
 import scipy.signal as signal
 
@@ -60,3 +61,19 @@ def to_zpk(model):
                 type_ = signal.dlti
             return type_([], [], model.num[0])
     return model.to_zpk()
+
+
+_zpk_cache = weakref.WeakKeyDictionary()
+
+
+def as_zpk(model):
+    if isinstance(model, signal.ZerosPolesGain):
+        return model  # do not copy (nor keep alive) ZPK models
+    # models are not mutated in place, blocks are
+    # replaced instead, so conversions can be safely reused
+    try:
+        return _zpk_cache[model]
+    except KeyError:
+        pass
+    zpk_model = _zpk_cache[model] = to_zpk(model)
+    return zpk_model
@@ -27,12 +27,10 @@ import sympy
 def pretty(model):
     if isinstance(model, ltisys.TransferFunction):
         if model.dt is None:  # continuous time
-            s = sympy.Symbol("s")
-            num = sum(c * s ** i for i, c in enumerate(reversed(model.num)))
-            den = sum(c * s ** i for i, c in enumerate(reversed(model.den)))
+            x = sympy.Symbol("s")
         else:  # discrete time
-            z = sympy.Symbol("z")
-            num = sum(c * z ** i for i, c in enumerate(reversed(model.num)))
-            den = sum(c * z ** i for i, c in enumerate(reversed(model.den)))
+            x = sympy.Symbol("z")
+        num = sympy.Poly(list(model.num), x).as_expr()
+        den = sympy.Poly(list(model.den), x).as_expr()
         return sympy.pretty(num / den, use_unicode=True, num_columns=sys.maxsize)
     raise TypeError("Unknown model type")
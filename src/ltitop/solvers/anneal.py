@@ -31,12 +31,8 @@ def cast(*args, **kwargs):
             self.state = toolbox.mutate(self.state)
 
         def energy(self):
-            print(self.state)
             self.state.fitness.values = toolbox.evaluate(self.state)
-            return sum(
-                w * v
-                for w, v in zip(self.state.fitness.weights, self.state.fitness.values)
-            )
+            return sum(self.state.fitness.wvalues)
 
         def anneal(self):
             state, _ = super().anneal()
@@ -30,7 +30,7 @@ def probably(func):
 
 @probably
 def expand_one_block(diagram):
-    u, v, k = edge = random.choice(diagram.edges(keys=True))
+    u, v, k = edge = random.choice(list(diagram.edges(keys=True)))
     block = diagram.edges[edge]['block']
     diagram.remove_edge(u, v, k)
     if bool(random.getrandbits(1)):  # expand in series
@@ -47,24 +47,22 @@ def expand_one_block(diagram):
 
 @probably
 def collapse_one_variable(diagram):
-    internal_variables = {
-        variable for variable, succesors in
-        diagram.succ if len(successors) == 1
-    }.intersection({
-        variable for variable, predecessors in
-        diagram.pred if len(predecessors) == 1
-    })
+    pred = diagram.pred
+    internal_variables = [
+        variable for variable, successors in diagram.succ.items()
+        if len(successors) == 1 and len(pred[variable]) == 1
+    ]
     if internal_variables:
         variable = random.choice(internal_variables)
         predecessor = next(diagram.predecessors(variable))
         successor = next(diagram.successors(variable))
-        in_edges = diagram.in_edges(variable, keys=True, data='block')
-        out_edges = diagram.out_edges(variable, keys=True, data='block')
+        in_edges = list(diagram.in_edges(variable, keys=True, data='block'))
+        out_edges = list(diagram.out_edges(variable, keys=True, data='block'))
         block = series_composition([
             parallel_composition([block for *_, block in in_edges]),
             parallel_composition([block for *_, block in out_edges])
         ])
-        for u, v, k, _ for itertools.chain(in_edges, out_edges):
+        for u, v, k, _ in itertools.chain(in_edges, out_edges):
             diagram.remove_edge(u, v, k)
         diagram.add_edge(predecessor, successor, block=block)
     return diagram,
@@ -95,8 +93,10 @@ def multipoint_algorithm_swap(diagram1, diagram2):
             algorithm2 = block2.algorithm
             procedure1 = algorithm1.procedure
             procedure2 = algorithm2.procedure
-            procedure1 = procedure1[:cxpoint] + procedure2[cxpoint:]
-            procedure2 = procedure1[:cxpoint] + procedure2[cxpoint:]
+            procedure1, procedure2 = (
+                procedure1[:cxpoint] + procedure2[cxpoint:],
+                procedure2[:cxpoint] + procedure1[cxpoint:]
+            )
             algorithm1 = dataclasses.replace(algorithm1, procedure=procedure1)
             algorithm2 = dataclasses.replace(algorithm2, procedure=procedure2)
             block1 = dataclasses.replace(block1, algorithm=algorithm1)
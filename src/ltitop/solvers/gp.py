@@ -18,11 +18,16 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with ltitop.  If not, see <http://www.gnu.org/licenses/>.
 
+import collections
+import concurrent.futures
+import contextlib
 import dataclasses
 import functools
 import hashlib
 import math
 import operator
+import os
+import weakref
 
 import deap.algorithms
 import deap.base
@@ -44,6 +49,23 @@ def md5(*items):
     return hashlib.md5(repr(items).encode()).hexdigest()[:15]
 
 
+_decompositions = weakref.WeakKeyDictionary()
+
+
+def _decompose(decomposition, model, n, variant, tol):
+    # GP trees share (sub)models, and thus decompositions
+    cache = _decompositions.setdefault(model, {})
+    key = (decomposition, n, variant, tol)
+    try:
+        return cache[key]
+    except KeyError:
+        pass
+    except TypeError:  # unhashable variant
+        return decomposition(model, n, variant, tol=tol)
+    cache[key] = result = decomposition(model, n, variant, tol=tol)
+    return result
+
+
 def _series(*operators, variant, tol):
     def __implementation(model, **kwargs):
         return series_diagram(
@@ -51,7 +73,9 @@ def _series(*operators, variant, tol):
                 operator(submodel)
                 for operator, submodel in zip(
                     operators,
-                    series_decomposition(model, len(operators), variant, tol=tol),
+                    _decompose(
+                        series_decomposition, model, len(operators), variant, tol
+                    ),
                 )
             ],
             **kwargs,
@@ -67,7 +91,9 @@ def _parallel(*operators, variant, tol):
                 operator(submodel)
                 for operator, submodel in zip(
                     operators,
-                    parallel_decomposition(model, len(operators), variant, tol=tol),
+                    _decompose(
+                        parallel_decomposition, model, len(operators), variant, tol
+                    ),
                 )
             ],
             **kwargs,
@@ -80,13 +106,103 @@ def _realize(model, *, form, **kwargs):
     return as_diagram(form.from_model(model, **kwargs))
 
 
-def _evaluate(code, *, func, model, compiler):
-    fitness = func(compiler(code), model)
+def _compile(code, *, pset):
+    if pset.arguments:
+        return deap.gp.compile(code, pset)
+    # argumentless codes can be evaluated right away, and
+    # being prefix notation, a pass over them in reverse order suffices
+    stack = []
+    for node in reversed(code):
+        if isinstance(node, deap.gp.Primitive):
+            args = stack[-node.arity :][::-1] if node.arity else []
+            del stack[len(stack) - node.arity :]
+            stack.append(pset.context[node.name](*args))
+        elif node.conv_fct is str:  # symbolic terminal
+            stack.append(pset.context[node.value])
+        else:
+            stack.append(node.value)
+    (value,) = stack
+    return value
+
+
+@functools.lru_cache(maxsize=None)
+def _field_names(cls):
+    return tuple(field.name for field in dataclasses.fields(cls))
+
+
+def _as_fitness_values(fitness):
+    # unlike dataclasses.astuple(), do not deep copy values
     if dataclasses.is_dataclass(fitness):
-        fitness = dataclasses.astuple(fitness)
+        return tuple(getattr(fitness, name) for name in _field_names(type(fitness)))
     return fitness
 
 
+def _evaluate(code, *, func, model, compiler):
+    return _as_fitness_values(func(compiler(code), model))
+
+
+_worker = None
+
+
+def _init_worker(func, model, pset):
+    global _worker
+    _worker = (func, model, pset)
+
+
+def _evaluate_in_worker(code):
+    func, model, pset = _worker
+    code = deap.gp.PrimitiveTree.from_string(code, pset)
+    return _evaluate(
+        code, func=func, model=model, compiler=functools.partial(_compile, pset=pset)
+    )
+
+
+def _evaluate_in_workers(codes, *, executor, n_workers):
+    codes = [str(code) for code in codes]
+    chunksize = max(len(codes) // (4 * n_workers), 1)
+    return list(executor.map(_evaluate_in_worker, codes, chunksize=chunksize))
+
+
+@contextlib.contextmanager
+def evaluation_workers(toolbox, max_workers=None):
+    """
+    Evaluate individuals in a pool of worker processes within context.
+
+    Workers get the evaluation function, the prototype model and the
+    primitive set once, on startup. Only code strings are sent over to
+    evaluate them. The pool is shut down on context exit.
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    initargs = getattr(toolbox, "worker_context", None)
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_worker if initargs else None,
+        initargs=initargs or (),
+    ) as executor:
+        map_, batch_evaluate = toolbox.map, toolbox.batch_evaluate
+        toolbox.register("map", executor.map)
+        if initargs:
+            toolbox.register(
+                "batch_evaluate",
+                _evaluate_in_workers,
+                executor=executor,
+                n_workers=max_workers,
+            )
+        try:
+            yield toolbox
+        finally:
+            toolbox.map, toolbox.batch_evaluate = map_, batch_evaluate
+
+
+def _evaluate_batch(codes, *, func, model, compiler):
+    fitnesses = func([compiler(code) for code in codes], model)
+    return [_as_fitness_values(fitness) for fitness in fitnesses]
+
+
+def _evaluate_each(codes, *, toolbox):
+    return list(toolbox.map(toolbox.evaluate, codes))
+
+
 def _graph(code, pset):
     nodes, edges, labels = deap.gp.graph(code)
     labels = {i: label_for(pset.context[name]) for i, name in labels.items()}
@@ -112,7 +228,16 @@ class Code(deap.gp.PrimitiveTree):
 
 
 def formulate(
-    prototype, *, transforms, evaluate, weights, forms, variants, dtype=float, tol=1e-16
+    prototype,
+    *,
+    transforms,
+    evaluate,
+    weights,
+    forms,
+    variants,
+    dtype=float,
+    tol=1e-16,
+    batch_evaluate=None,
 ):
     pfunc = deap.base.Toolbox()
     pfunc.register("series", _series)
@@ -141,27 +266,41 @@ def formulate(
     toolbox.pset = pset
     toolbox.pfunc = pfunc
     order = len(prototype.poles)
+    max_height = math.ceil(math.log2(order))
     toolbox.register(
         "code",
         deap.gp.genHalfAndHalf,
         pset=pset,
         min_=1,
-        max_=max(math.ceil(math.log2(order)), 1),
+        max_=max(max_height, 1),
     )
     toolbox.register("code_snippet", deap.gp.genFull, pset=pset, min_=0, max_=2)
     toolbox.register("individual", lambda: Code(toolbox.code(), weights))
     toolbox.register("population", deap.tools.initRepeat, list, toolbox.individual)
-    toolbox.register("compile", deap.gp.compile, pset=pset)
+    toolbox.register("compile", _compile, pset=pset)
     toolbox.register(
         "evaluate",
         functools.partial(
             _evaluate, func=evaluate, model=prototype, compiler=toolbox.compile
         ),
     )
+    if batch_evaluate is not None:
+        toolbox.register(
+            "batch_evaluate",
+            functools.partial(
+                _evaluate_batch,
+                func=batch_evaluate,
+                model=prototype,
+                compiler=toolbox.compile,
+            ),
+        )
+    else:
+        toolbox.register("batch_evaluate", _evaluate_each, toolbox=toolbox)
+        toolbox.worker_context = (evaluate, prototype, pset)
     toolbox.register("graph", _graph, pset=pset)
 
     order_limit = deap.gp.staticLimit(
-        key=operator.attrgetter("height"), max_value=math.ceil(math.log2(order))
+        key=operator.attrgetter("height"), max_value=max_height
     )
     toolbox.register("mutate", deap.gp.mutUniform, expr=toolbox.code_snippet, pset=pset)
     toolbox.decorate("mutate", order_limit)
@@ -186,6 +325,74 @@ def label_for(value):
     return str(value)
 
 
+def _evaluate_with_cache(individuals, toolbox, cache):
+    keys = [str(ind) for ind in individuals]
+    pending = {}
+    for key, ind in zip(keys, individuals):
+        if key not in cache and key not in pending:
+            pending[key] = ind
+    batch_evaluate = getattr(toolbox, "batch_evaluate", None)
+    if batch_evaluate is None:
+        batch_evaluate = functools.partial(_evaluate_each, toolbox=toolbox)
+    fitnesses = batch_evaluate(list(pending.values()))
+    cache.update(zip(pending.keys(), fitnesses))
+    unfeasible = []
+    for key, ind in zip(keys, individuals):
+        fit = cache[key]
+        if fit is None:
+            unfeasible.append(ind)
+            continue
+        ind.fitness.values = fit
+    return unfeasible, len(pending)
+
+
+def _without(individuals, excluded):
+    # filter by identity, equal codes may be different individuals
+    if not excluded:
+        return individuals
+    excluded = set(map(id, excluded))
+    return [ind for ind in individuals if id(ind) not in excluded]
+
+
+def _nondominated(wvalues, block_size=256):
+    nondominated = np.empty(len(wvalues), dtype=bool)
+    for start in range(0, len(wvalues), block_size):
+        block = wvalues[start : start + block_size, np.newaxis, :]
+        dominates = np.logical_and(
+            np.all(wvalues[np.newaxis, :, :] >= block, axis=-1),
+            np.any(wvalues[np.newaxis, :, :] > block, axis=-1),
+        )
+        nondominated[start : start + block_size] = ~np.any(dominates, axis=-1)
+    return nondominated
+
+
+def _update_halloffame(halloffame, population):
+    if not isinstance(halloffame, deap.tools.ParetoFront) or not population:
+        halloffame.update(population)
+        return
+    # same as ParetoFront.update(), but with dominance
+    # checks for all individuals vectorized
+    individuals = list(halloffame) + list(population)
+    wvalues = np.array([ind.fitness.wvalues for ind in individuals])
+    nondominated = _nondominated(wvalues)
+    for index in reversed(range(len(halloffame))):
+        if not nondominated[index]:
+            halloffame.remove(index)
+    twins = collections.defaultdict(list)
+    for hofer in halloffame:
+        twins[hofer.fitness.wvalues].append(hofer)
+    for ind, keep in zip(
+        population, nondominated[len(individuals) - len(population) :]
+    ):
+        if not keep:
+            continue
+        candidates = twins[ind.fitness.wvalues]
+        if any(halloffame.similar(ind, hofer) for hofer in candidates):
+            continue
+        halloffame.insert(ind)
+        candidates.append(ind)
+
+
 def nsga2(
     population,
     toolbox,
@@ -201,33 +408,32 @@ def nsga2(
     verbose=__debug__,
 ):
     logbook = deap.tools.Logbook()
-    logbook.header = ["gen", "nevals", "nunfeas"]
+    logbook.header = ["gen", "nevals", "nhits", "nunfeas"]
     if stats is not None:
         logbook.header += stats.fields
 
     mu = mu or len(population)
     lambda_ = lambda_ or len(population)
 
+    # populations are riddled with duplicate individuals,
+    # cache fitnesses (and unfeasibility) by code across generations
+    cache = {}
+
     # Evaluate the individuals with an invalid fitness
-    nunfeas = 0
     invalid_ind = [ind for ind in population if not ind.fitness.valid]
-    fitnesses = toolbox.map(toolbox.evaluate, invalid_ind)
-    for ind, fit in zip(invalid_ind, fitnesses):
-        if fit is None:
-            population.remove(ind)
-            nunfeas += 1
-            continue
-        ind.fitness.values = fit
+    unfeasible_ind, nevals = _evaluate_with_cache(invalid_ind, toolbox, cache)
+    population = _without(population, unfeasible_ind)
+    nunfeas = len(unfeasible_ind)
+    nhits = len(invalid_ind) - nevals
 
     if halloffame is not None:
-        halloffame.update(population)
+        _update_halloffame(halloffame, population)
 
     # This is just to assign the crowding distance to the individuals
     population = deap.tools.selNSGA2(population, len(population))
 
-    nevals = len(invalid_ind) - nunfeas
     record = stats.compile(population) if stats is not None else {}
-    logbook.record(gen=0, nevals=nevals, nunfeas=nunfeas, **record)
+    logbook.record(gen=0, nevals=nevals, nhits=nhits, nunfeas=nunfeas, **record)
     if verbose:
         print(logbook.stream)
 
@@ -239,40 +445,49 @@ def nsga2(
         )
 
         # Evaluate the individuals with an invalid fitness
-        nunfeas = 0
         invalid_ind = [ind for ind in offspring if not ind.fitness.valid]
-        fitnesses = toolbox.map(toolbox.evaluate, invalid_ind)
-        for ind, fit in zip(invalid_ind, fitnesses):
-            if fit is None:
-                offspring.remove(ind)
-                nunfeas += 1
-                continue
-            ind.fitness.values = fit
+        unfeasible_ind, nevals = _evaluate_with_cache(invalid_ind, toolbox, cache)
+        offspring = _without(offspring, unfeasible_ind)
+        nunfeas = len(unfeasible_ind)
+        nhits = len(invalid_ind) - nevals
 
         population = deap.tools.selNSGA2(population + offspring, mu, nd="log")
 
         if halloffame is not None:
-            halloffame.update(population)
+            _update_halloffame(halloffame, population)
 
-        nevals = len(invalid_ind) - nunfeas
         record = stats.compile(population) if stats is not None else {}
-        logbook.record(gen=gen, nevals=nevals, nunfeas=nunfeas, **record)
+        logbook.record(gen=gen, nevals=nevals, nhits=nhits, nunfeas=nunfeas, **record)
         if verbose:
             print(logbook.stream)
 
     return population, logbook
 
 
-def argnondominated(*scores):
-    dominated = []
-    scores = np.array(scores, dtype=object).T
-    for i in range(len(scores) - 1):
-        if i in dominated:
-            continue
-        for j in range(i + 1, len(scores)):
-            if all(scores[i] >= scores[j]):
-                dominated.append(j)
-            elif all(scores[j] >= scores[i]):
-                dominated.append(i)
-                break
-    return [k for k in range(len(scores)) if k not in dominated]
+def argnondominated(*scores, block_size=256):
+    scores = np.asarray(scores, dtype=np.float64).T
+    dominated = np.empty(len(scores), dtype=bool)
+    indices = np.arange(len(scores))
+    if len(scores) > 0 and scores.shape[-1] == 2:
+        # in descending order of the first score (and second,
+        # and then ascending order of appearance), a point is dominated
+        # iff a preceding point has a second score at least as large
+        order = np.lexsort((indices, -scores[:, 1], -scores[:, 0]))
+        second_scores = scores[order, 1]
+        best_second_scores = np.maximum.accumulate(second_scores)
+        dominated[order[0]] = False
+        dominated[order[1:]] = best_second_scores[:-1] >= second_scores[1:]
+        return np.flatnonzero(~dominated).tolist()
+    # compare in blocks to bound memory usage
+    for start in range(0, len(scores), block_size):
+        block = scores[start : start + block_size, np.newaxis, :]
+        is_dominated_by = np.all(scores[np.newaxis, :, :] >= block, axis=-1)
+        dominates = np.all(block >= scores[np.newaxis, :, :], axis=-1)
+        # Ties are resolved in favor of earlier scores
+        comes_first = (
+            indices[np.newaxis, :] < indices[start : start + block_size, np.newaxis]
+        )
+        dominated[start : start + block_size] = np.any(
+            is_dominated_by & (~dominates | comes_first), axis=-1
+        )
+    return np.flatnonzero(~dominated).tolist()
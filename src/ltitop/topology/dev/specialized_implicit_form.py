@@ -20,9 +20,12 @@
 
 
 import collections
+import functools
 import itertools
 
 import numpy
+import scipy.linalg
+import scipy.signal
 import sympy
 
 
@@ -55,14 +58,48 @@ class SpecializedImplicitModel(Model):
 
         @memoize
         def to_state_space(self):
-            J_inverse = self.J.inv()
+            if self.is_numeric():
+                return self.to_state_space_numeric()
+            # Solve for J^-1 [M N] at once, no need for an explicit inverse
+            J_inverse_MN = self.J.LUsolve(self.M.row_join(self.N))
+            J_inverse_M = J_inverse_MN[:, : self.M.cols]
+            J_inverse_N = J_inverse_MN[:, self.M.cols :]
             return StateSpaceRealization.Parameters(
-                A=self.K * J_inverse * self.M + self.P,
-                B=self.K * J_inverse * self.N + self.Q,
-                C=self.L * J_inverse * self.M + self.R,
-                D=self.L * J_inverse * self.N + self.S,
+                A=self.K * J_inverse_M + self.P,
+                B=self.K * J_inverse_N + self.Q,
+                C=self.L * J_inverse_M + self.R,
+                D=self.L * J_inverse_N + self.S,
             )
 
+        @memoize
+        def to_state_space_numeric(self):
+            J, M, N, K, P, Q, L, R, S = (
+                numpy.array(matrix, dtype=numpy.float64) for matrix in self._matrices()
+            )
+            MN = numpy.hstack([M, N])
+            if not numpy.any(numpy.triu(J, 1)):
+                # algorithms assume J is lower triangular,
+                # back substitution is enough then
+                J_inverse_MN = scipy.linalg.solve_triangular(
+                    J, MN, lower=True, check_finite=False
+                )
+            else:
+                J_inverse_MN = numpy.linalg.solve(J, MN)
+            J_inverse_M = J_inverse_MN[:, : M.shape[1]]
+            J_inverse_N = J_inverse_MN[:, M.shape[1] :]
+            return StateSpaceRealization.Parameters(
+                A=K @ J_inverse_M + P,
+                B=K @ J_inverse_N + Q,
+                C=L @ J_inverse_M + R,
+                D=L @ J_inverse_N + S,
+            )
+
+        def is_numeric(self):
+            return not any(matrix.free_symbols for matrix in self._matrices())
+
+        def _matrices(self):
+            return tuple(getattr(self, name) for name in self.__slots__)
+
         @memoize
         def to_matrix(self):
             return sympy.Matrix(
@@ -74,19 +111,20 @@ class SpecializedImplicitModel(Model):
             )
 
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def _make_algorithm(n_t, n_x, n_u, n_y):
         # Define inputs (parameters included)
         X_k = sympy.MatrixSymbol("X(k)", n_x, 1)
         U_k = sympy.MatrixSymbol("U(k)", n_u, 1)
         J = sympy.MatrixSymbol("J", n_t, n_t)
         M = sympy.MatrixSymbol("M", n_t, n_x)
-        N = sympy.MatrixSymbol("M", n_t, n_u)
+        N = sympy.MatrixSymbol("N", n_t, n_u)
         K = sympy.MatrixSymbol("K", n_x, n_t)
         P = sympy.MatrixSymbol("P", n_x, n_x)
         Q = sympy.MatrixSymbol("Q", n_x, n_u)
-        L = sympy.MatrixSymbol("K", n_y, n_t)
-        R = sympy.MatrixSymbol("P", n_y, n_x)
-        S = sympy.MatrixSymbol("Q", n_y, n_u)
+        L = sympy.MatrixSymbol("L", n_y, n_t)
+        R = sympy.MatrixSymbol("R", n_y, n_x)
+        S = sympy.MatrixSymbol("S", n_y, n_u)
         inputs = X_k, U_k, J, M, N, K, P, Q, L, R, S
 
         # Define outputs
@@ -103,13 +141,13 @@ class SpecializedImplicitModel(Model):
         mU_k = sympy.Matrix(U_k)
         mJ = sympy.Matrix(J)
         mM = sympy.Matrix(M)
-        mN = sympy.Matrix(M)
+        mN = sympy.Matrix(N)
         mK = sympy.Matrix(K)
         mP = sympy.Matrix(P)
         mQ = sympy.Matrix(Q)
-        mL = sympy.Matrix(K)
-        mR = sympy.Matrix(P)
-        mS = sympy.Matrix(Q)
+        mL = sympy.Matrix(L)
+        mR = sympy.Matrix(R)
+        mS = sympy.Matrix(S)
 
         subalgorithms = []
 
@@ -205,6 +243,13 @@ class SpecializedImplicitModel(Model):
         return StateSpaceModel(*self.parameters.to_state_space())
 
     def process(self, U, X=None):
+        if self.parameters.is_numeric():
+            A, B, C, D = astuple(self.parameters.to_state_space_numeric())
+            U = numpy.asarray(U, dtype=numpy.float64).reshape(len(U), -1)
+            if X is not None:
+                X = numpy.asarray(X, dtype=numpy.float64).ravel()
+            _, Y, X = scipy.signal.dlsim((A, B, C, D, 1), U, x0=X)
+            return X, Y
         if X is None:
             X = sympy.zeros(self.n_x, 1)
         J, M, N, K, P, Q, L, R, S = astuple(self.parameters)
@@ -20,9 +20,11 @@
 
 
 import collections
+import functools
 import itertools
 
 import numpy
+import scipy.signal
 import sympy
 
 
@@ -43,6 +45,7 @@ class StateSpaceErrorModel(Model):
         def __post_init__(self):
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def _make_algorithm(n_x, n_u, n_y):
         # Define inputs (parameters included)
         X_k = sympy.MatrixSymbol('X(k)', n_x, 1)
@@ -89,21 +92,21 @@ class StateSpaceErrorModel(Model):
         subalgorithms.append(tuple(
             Assignment(mX_kk[i], nonassociative(
                 mA[i, :] * mX_k + mB[i, :] * mU_k
-            )) for range i in range(n_x)
+            )) for i in range(n_x)
         ) + (Assignment(X_kk, mX_kk),))
 
         subalgorithms.append(tuple(
             Assignment(mdX_kk[i], nonassociative(
                 mdA[i, :] * mX_k + mAq[i, :] * mdX_k +
                 mdB[i, :] * mU_k + mEx_k[i]
-            )) for range i in range(n_x)
+            )) for i in range(n_x)
         ) + (Assignment(dX_kk, mdX_kk),))
 
         subalgorithms.append(tuple(
             Assignment(mdY_k[i], nonassociative(
                 mdC[i, :] * mX_k + mCq[i, :] * mdX_k +
                 mdD[i, :] * mU_k + mEy_k[i]
-            )) for range i in range(n_y)
+            )) for i in range(n_y)
         ) + (Assignment(dY_k, mdY_k),))
 
         subalgorithms = tuple(subalgorithms)
@@ -165,7 +168,7 @@ class StateSpaceModel(Model):
             ])
 
     @staticmethod
-    @memoize
+    @functools.lru_cache(maxsize=None)
     def _make_algorithm(n_x, n_u, n_y):
         # Define inputs (parameters included)
         X_k = sympy.MatrixSymbol('X(k)', n_x, 1)
@@ -226,12 +229,22 @@ class StateSpaceModel(Model):
     @property
     @memoize
     def stable(self):
-        return all(value < 0 for value in self.parameters.A.eigenvals())
+        A = self.parameters.A
+        if not A.free_symbols:
+            eigenvalues = numpy.linalg.eigvals(numpy.array(A).astype(complex))
+            return bool(numpy.all(eigenvalues.real < 0))
+        return all(value < 0 for value in A.eigenvals())
 
     @property
     @memoize
     def dc_gain(self):
         A, B, C, D = self.parameters
+        if not any(M.free_symbols for M in (A, B, C, D)):
+            A, B, C, D = (
+                numpy.array(M).astype(numpy.float64) for M in (A, B, C, D)
+            )
+            I = numpy.eye(self.n_x)
+            return sympy.Matrix(C @ numpy.linalg.solve(I - A, B) + D)
         I = sympy.eye(self.n_x, self.n_x)
         return C * (I - A).inv() * B + D
 
@@ -260,12 +273,21 @@ class StateSpaceModel(Model):
         )
 
     def process(self, U, X0):
+        A, B, C, D = self.parameters
+        if not any(M.free_symbols for M in (A, B, C, D)):
+            A, B, C, D = (
+                numpy.array(M).astype(numpy.float64) for M in (A, B, C, D)
+            )
+            U = numpy.asarray(U, dtype=numpy.float64).reshape(len(U), -1)
+            if X0 is not None:
+                X0 = numpy.asarray(X0, dtype=numpy.float64).ravel()
+            _, Y, X = scipy.signal.dlsim((A, B, C, D, 1), U, x0=X0)
+            return X, Y
         Y = [None] * len(U)
         X = [None] * len(U)
         if X0 is None:
             X0 = sympy.zeros(self.n_x, 1)
         X[0] = X0
-        A, B, C, D = self.parameters
         for k in range(len(U)):
             X[k + 1], Y[k] = \
                 self.algorithm.perform(
@@ -18,6 +18,9 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with ltitop.  If not, see <http://www.gnu.org/licenses/>.
 
+import functools
+import operator
+
 import networkx as nx
 import numpy as np
 
@@ -61,7 +64,7 @@ def spectral_radii(diagram, source=None, target=None):
 
 
 def analytic_diagram(diagram, source_ranges=None):
-    assert not any(nx.simple_cycles(diagram))
+    assert nx.is_directed_acyclic_graph(diagram)
 
     if source_ranges:
         if not isinstance(source_ranges, dict):
@@ -139,12 +142,14 @@ def analytic_diagram(diagram, source_ranges=None):
                 data["worst_case_peak_gain"] += transitive_worst_case_peak_gain
                 data["error_bounds"] += transitive_error_bounds
         if dependency_ranges:
-            error_bounds = np.sum(
-                [error_bounded(fixed(r)) for r in dependency_ranges]
+            error_bounds = functools.reduce(
+                operator.add, (error_bounded(fixed(r)) for r in dependency_ranges)
             ).error_bounds
             for edge in analytic_diagram.in_edges(variable):
                 analytic_diagram.edges[edge]["error_bounds"] += error_bounds
-            variable_ranges[variable] = np.sum(dependency_ranges)
+            variable_ranges[variable] = functools.reduce(
+                operator.add, dependency_ranges
+            )
     return analytic_diagram
 
 
@@ -206,7 +211,7 @@ def output_range(diagram, source_range, source=None, target=None):
 
     a = target_mean - target_delta
     b = target_mean + target_delta
-    return interval(np.min([a, b], axis=0), np.max([a, b], axis=0))
+    return interval(np.minimum(a, b), np.maximum(a, b))
 
 
 def signal_path(diagram, source=None, target=None):
@@ -217,8 +222,12 @@ def signal_path(diagram, source=None, target=None):
     if target not in diagram:
         raise ValueError(f"{target} not in diagram")
 
-    paths = nx.all_simple_paths(diagram, source, target)
-    nodes = {node for path in paths for node in path}
+    # in a DAG, nodes in any path from source to target
+    # are those both reachable from source and able to reach target
+    descendants = nx.descendants(diagram, source)
+    if target not in descendants:
+        return diagram.subgraph([])
+    nodes = (descendants & nx.ancestors(diagram, target)) | {source, target}
     return diagram.subgraph(nodes)
 
 
@@ -230,33 +239,47 @@ def signal_processing_function(diagram, source=None, target=None):
         raise ValueError(f"{source} not in diagram")
     if target not in diagram:
         raise ValueError(f"{target} not in diagram")
-    assert not any(nx.simple_cycles(diagram))
+    assert nx.is_directed_acyclic_graph(diagram)
 
     diagram = signal_path(diagram, source, target)
 
-    functional_relations = {}
-    topologically_sorted_dependency_graph = []
-    for variable in nx.topological_sort(diagram):
+    # index variables by position to avoid
+    # hashing symbols on every call
+    variables = list(nx.topological_sort(diagram))
+    indices = {variable: i for i, variable in enumerate(variables)}
+    topologically_sorted_functional_relations = []
+    for variable in variables:
         if variable is source:
             continue
-        dependency_list = tuple(diagram.predecessors(variable))
-        for dependency in dependency_list:
-            functional_relations[variable, dependency] = tuple(
-                data["block"].to_function()
-                for data in diagram[dependency][variable].values()
-            )
-        topologically_sorted_dependency_graph.append((variable, dependency_list))
+        functional_relations = tuple(
+            (indices[dependency], data["block"].to_function())
+            for dependency in diagram.predecessors(variable)
+            for data in diagram[dependency][variable].values()
+        )
+        assert functional_relations  # TODO(hidmic): support source passivation
+        topologically_sorted_functional_relations.append(
+            (indices[variable], functional_relations)
+        )
+    source_index = indices[source]
+    target_index = indices[target]
 
     def _function(inputs):
-        values = {source: inputs}
-        for variable, dependencies in topologically_sorted_dependency_graph:
-            terms = [
-                func(values[dependency])
-                for dependency in dependencies
-                for func in functional_relations[variable, dependency]
-            ]
-            assert terms  # TODO(hidmic): support source passivation
-            values[variable] = np.sum(terms, axis=0) if len(terms) > 1 else terms[0]
-        return values[target]
+        values = [None] * len(variables)
+        values[source_index] = inputs
+        for index, functional_relations in topologically_sorted_functional_relations:
+            value = None
+            for dependency_index, func in functional_relations:
+                term = func(values[dependency_index])
+                if value is None:
+                    value = term
+                    owned = False
+                elif owned and np.result_type(value, term) == value.dtype:
+                    # accumulate in place once we own the buffer
+                    np.add(value, term, out=value)
+                else:
+                    value = np.add(value, term)
+                    owned = True
+            values[index] = value
+        return values[target_index]
 
     return _function
@@ -24,19 +24,20 @@ import itertools
 import networkx as nx
 import sympy
 
-from ltitop.models.transforms import to_zpk
+from ltitop.models.transforms import as_zpk
 
 
 def _tempnode(diagram, skip=None, suffix="tmp", factory=str):
     key = suffix, factory
     if key not in diagram.graph:
         node_generator = (factory(f"{suffix}{i}") for i in itertools.count())
-        unique_node_generator = (
-            node for node in node_generator if node not in diagram.nodes
+        unique_node_generator = itertools.filterfalse(
+            diagram.nodes.__contains__, node_generator
         )
         diagram.graph[key] = unique_node_generator
-    skip = skip or []
-    return next(node for node in diagram.graph[key] if node not in skip)
+    if not skip:
+        return next(diagram.graph[key])
+    return next(itertools.filterfalse(skip.__contains__, diagram.graph[key]))
 
 
 tempvar = functools.partial(_tempnode, suffix="var", factory=sympy.Symbol)
@@ -63,12 +64,14 @@ def add_subdiagram(diagram, input_, output, subdiagram):
         }
     )
 
-    if mapping:
-        subdiagram = nx.relabel_nodes(subdiagram, mapping)
-
     # Manually update the diagram to avoid modifying .graph
-    diagram.add_nodes_from(subdiagram.nodes.data())
-    diagram.add_edges_from(subdiagram.edges.data())
+    diagram.add_nodes_from(
+        (mapping.get(node, node), data) for node, data in subdiagram.nodes.data()
+    )
+    diagram.add_edges_from(
+        (mapping.get(u, u), mapping.get(v, v), data)
+        for u, v, data in subdiagram.edges.data()
+    )
 
 
 def input_of(block):
@@ -119,7 +122,7 @@ def series_diagram(blocks, input_=None, output=None, simplify=True):
                 nonredundant_blocks.append(block)
                 continue
             _, _, block = next(iter(block.edges(data="block")))
-        model = to_zpk(block.model)
+        model = as_zpk(block.model)
         if simplify:
             if model.gain == 0.0:
                 return as_diagram(block, input_=input_, output=output)
@@ -166,7 +169,7 @@ def parallel_diagram(blocks, input_=None, output=None, simplify=True):
                 nonredundant_blocks.append(block)
                 continue
             _, _, block = next(iter(block.edges(data="block")))
-        model = to_zpk(block.model)
+        model = as_zpk(block.model)
         if simplify and model.gain == 0.0:
             continue
         nonredundant_blocks.append(block)
@@ -18,13 +18,26 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with ltitop.  If not, see <http://www.gnu.org/licenses/>.
 
+import functools
 import sys
 
 import pygraphviz as pgv
 import sympy
 
 
-def pretty(diagram):
+@functools.lru_cache(maxsize=1024)
+def _cached_label_for(block):
+    return sympy.pretty(block, num_columns=sys.maxsize)
+
+
+def _label_for(block):
+    try:
+        return _cached_label_for(block)
+    except TypeError:  # unhashable block
+        return sympy.pretty(block, num_columns=sys.maxsize)
+
+
+def pretty(diagram, layout=True):
     agraph = pgv.AGraph(
         directed=True,
         rankdir="TB",
@@ -44,12 +57,13 @@ def pretty(diagram):
         n = f"{v} += f({u}) ({w})"
         agraph.add_node(
             n,
-            label=sympy.pretty(block, num_columns=sys.maxsize),
+            label=_label_for(block),
             fontname="courier",
             shape="box",
             style="solid",
         )
         agraph.add_edge(u, n, style="solid", arrowsize=0.5)
         agraph.add_edge(n, v, style="solid", arrowsize=0.5)
-    agraph.layout(prog="dot")
+    if layout:
+        agraph.layout(prog="dot")
     return agraph
@@ -405,6 +405,40 @@ class DirectFormII(DirectForm):
         D = np.zeros((n_s, 1))
         return (signal.dlti(A, B, C, D),)
 
+    def _filter(self, inputs, initial_states):
+        b = self.parameters.b.astype(float)
+        a = self.parameters.a.astype(float)
+        if hasattr(self.parameters, "k"):
+            b = np.ldexp(b, self.parameters.k)
+            a[1:] = np.ldexp(a[1:], self.parameters.k)
+        ((n_s,),) = self.states
+        if initial_states is not None:
+            (past,) = initial_states
+            past = np.asarray(past, dtype=float)
+        else:
+            past = np.zeros(n_s)
+        # s[n] = x[n] - sum(a[i] * s[n - i]) and y[n] = sum(b[i] * s[n - i])
+        zi = signal.lfiltic([1.0], a, past)
+        s, _ = signal.lfilter([1.0], a, inputs, zi=zi)
+        s = np.concatenate((past[::-1], s))
+        outputs = signal.lfilter(b, [1.0], s)[n_s:]
+        states = np.lib.stride_tricks.sliding_window_view(s, n_s)[:, ::-1]
+        return states[:, np.newaxis, :].copy(), outputs[:, np.newaxis]
+
+    def process(self, inputs, initial_states=None):
+        inputs = np.c_[inputs]
+        arrays = [inputs, self.parameters.b, self.parameters.a]
+        if initial_states is not None:
+            arrays.extend(np.asarray(state) for state in initial_states)
+        if (
+            self._variant is None
+            and self.states
+            and inputs.shape[1] == 1
+            and all(array.dtype.kind == "f" for array in arrays)
+        ):
+            return self._filter(inputs[:, 0], initial_states)
+        return super().process(inputs, initial_states)
+
 
 @immutable_dataclass(init=False, repr=False)
 class TransposedDirectFormII(DirectForm):
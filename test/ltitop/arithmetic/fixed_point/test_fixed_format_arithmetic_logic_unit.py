@@ -18,6 +18,7 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with ltitop.  If not, see <http://www.gnu.org/licenses/>.
 
+import numpy as np
 import pytest
 
 from ltitop.arithmetic.errors import OverflowError, UnderflowError
@@ -45,6 +46,12 @@ def test_represent_errors():
     with pytest.raises(OverflowError):
         alu.represent(10)
 
+    with pytest.raises(UnderflowError):
+        alu.represent_array(np.array([0.5, 1e-3]))
+
+    with pytest.raises(OverflowError):
+        alu.represent_array(np.array([0.5, 10.0]))
+
 
 def test_represent():
     alu = FixedFormatArithmeticLogicUnit(
@@ -140,3 +147,19 @@ def test_multiply():
     z = alu.multiply(x, y)
     assert z.mantissa == 32
     assert z.format_ == alu.format_
+
+
+def test_represent_array():
+    alu = FixedFormatArithmeticLogicUnit(
+        format_=Q(7),
+        rounding_method=nearest_integer,
+        overflow_behavior=wraparound,
+        allows_overflow=True,
+        allows_underflow=True,
+    )
+    values = np.array([0, 0.25, -0.25, 0.3, -0.3, 1.5])
+    r = alu.represent_array(values)
+    assert r.format_ == alu.format_
+    np.testing.assert_array_equal(r.mantissa, [0, 32, -32, 38, -38, -64])
+    for value, mantissa in zip(values, r.mantissa):
+        assert alu.represent(value).mantissa == mantissa
@@ -53,3 +53,27 @@ def test_fixed_arithmetic():
         assert_close(fixed(0.3) - fixed(0.2), 0.1, atol=2 ** alu.format_.lsb)
         assert_close(-fixed(0.3) + fixed(0.2), -0.1, atol=2 ** alu.format_.lsb)
         assert_close(fixed(0.3) * fixed(0.2), 0.06, atol=2 ** alu.format_.lsb)
+
+
+def test_fixed_comparison_with_scalars():
+    with FixedFormatArithmeticLogicUnit(format_=Q(7), rounding_method=nearest_integer):
+        x = fixed(0.5)
+        assert x < 2
+        assert x <= 1.5
+        assert x > -3
+        assert x >= -1.5
+        assert not (x < -2.0)
+        assert x != 4
+        assert x == 0.5
+
+
+def test_fixed_arithmetic_with_scalars():
+    with FixedFormatArithmeticLogicUnit(
+        format_=Q(7), rounding_method=nearest_integer
+    ) as alu:
+        assert fixed(0.3) + 0.2 == fixed(0.3) + fixed(0.2)
+        assert 0.2 + fixed(0.3) == fixed(0.2) + fixed(0.3)
+        assert fixed(0.3) - 0.2 == fixed(0.3) - fixed(0.2)
+        assert fixed(0.3) * 0.2 == fixed(0.3) * fixed(0.2)
+        assert fixed(0.5) * -1 == fixed(-0.5)
+        assert_close(fixed(0.3) * 0.2, 0.06, atol=2 ** alu.format_.lsb)
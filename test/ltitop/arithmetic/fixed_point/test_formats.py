@@ -421,3 +421,14 @@ def test_best_formats():
     assert format_.msb == 5
     assert format_.lsb == -2
     assert format_.signed
+
+
+def test_float_value_interval():
+    format_ = Format(msb=7, lsb=-3, signed=True)
+    assert format_.float_value_interval == interval(-128.0, 127.875)
+
+    format_ = Format(msb=0, lsb=-63, signed=True)
+    value_interval = format_.value_interval
+    float_value_interval = format_.float_value_interval
+    assert float_value_interval.lower_bound <= value_interval.lower_bound
+    assert float_value_interval.upper_bound >= value_interval.upper_bound
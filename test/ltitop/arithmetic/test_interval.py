@@ -19,6 +19,7 @@
 # along with ltitop.  If not, see <http://www.gnu.org/licenses/>.
 
 import mpmath
+import numpy as np
 import pytest
 
 from ltitop.arithmetic.interval import interval
@@ -177,6 +178,9 @@ def test_interval_arithmetic(scalar):
     if scalar is not mpmath.mpf:
         assert iv_c // iv_b == interval(scalar(-4), scalar(4))
     assert iv_c % iv_b == scalar(0)
+    assert iv_c * scalar(-2) == interval(scalar(-16), scalar(-8))
+    assert scalar(-2) * iv_c == interval(scalar(-16), scalar(-8))
+    assert iv_c * scalar(2) == interval(scalar(8), scalar(16))
 
 
 def test_interval_bitwise():
@@ -214,3 +218,25 @@ def test_interval_membership(scalar):
     assert s_c not in iv_b
     assert s_c not in iv_c
     assert s_c not in iv_d
+
+
+def test_interval_hashing():
+    iv_a = interval(np.array([-1.0, 0.0]), np.array([1.0, 2.0]))
+    iv_b = interval(np.array([-1.0, 0.0]), np.array([1.0, 2.0]))
+    assert hash(iv_a) == hash(iv_b)
+    assert hash(iv_a[::-1]) != hash(iv_a)
+    assert hash(interval(1, 2)) == hash(interval(1, 2))
+
+
+def test_interval_span():
+    range_ = interval(-128, 127)
+    assert range_.span == 256
+    assert range_.mask == 255
+
+    range_ = interval(-5, 4)
+    assert range_.span == 10
+    assert range_.mask is None
+
+    range_ = interval(0.0, 255.0)
+    assert range_.span == 256.0
+    assert range_.mask is None
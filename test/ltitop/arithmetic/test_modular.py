@@ -18,6 +18,8 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with ltitop.  If not, see <http://www.gnu.org/licenses/>.
 
+import numpy as np
+
 from ltitop.arithmetic.interval import interval
 from ltitop.arithmetic.modular import wraparound
 
@@ -58,3 +60,45 @@ def test_wraparound():
     value, overflow = wraparound(-129, range_=interval(-128, 127))
     assert value == 127
     assert overflow
+
+
+def test_wraparound_arrays():
+    values, overflow = wraparound(
+        np.array([32, 128, -1, -129]), range_=interval(-128, 127)
+    )
+    np.testing.assert_array_equal(values, [32, -128, -1, 127])
+    np.testing.assert_array_equal(overflow, [False, True, False, True])
+
+    lower_bound = np.array([0, 100])
+    upper_bound = np.array([10, 130])
+    value, overflow = wraparound(
+        interval(lower_bound, upper_bound), range_=interval(-128, 127)
+    )
+    np.testing.assert_array_equal(value.lower_bound, [0, -128])
+    np.testing.assert_array_equal(value.upper_bound, [10, 127])
+    np.testing.assert_array_equal(overflow, [False, True])
+    np.testing.assert_array_equal(lower_bound, [0, 100])
+
+
+def test_wraparound_non_power_of_two_span():
+    value, overflow = wraparound(10, range_=interval(0, 9))
+    assert value == 0
+    assert overflow
+
+    value, overflow = wraparound(-3, range_=interval(-5, 4))
+    assert value == -3
+    assert not overflow
+
+    value, overflow = wraparound(-7, range_=interval(-5, 4))
+    assert value == 3
+    assert overflow
+
+    values, overflow = wraparound(
+        np.array([2 ** 70, -1], dtype=object), interval(0, 255)
+    )
+    np.testing.assert_array_equal(values, [0, 255])
+    np.testing.assert_array_equal(overflow, [True, True])
+
+    value, overflow = wraparound(128.5, range_=interval(-128, 127))
+    assert value == -127.5
+    assert overflow
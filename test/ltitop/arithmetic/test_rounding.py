@@ -19,8 +19,10 @@
 # along with ltitop.  If not, see <http://www.gnu.org/licenses/>.
 
 import mpmath
+import numpy as np
 import pytest
 
+from ltitop.arithmetic.interval import interval
 from ltitop.arithmetic.rounding import ceil, floor, nearest_integer, truncate
 
 
@@ -63,3 +65,53 @@ def test_truncate(scalar):
     assert scalar(1) == truncate.apply(scalar(1))
     assert scalar(1) == truncate.apply(scalar(1.4))
     assert scalar(1) == truncate.apply(scalar(1.6))
+
+
+def test_shift():
+    # -7 / 4 = -1.75, -6 / 4 = -1.5, 5 / 4 = 1.25, 6 / 4 = 1.5
+    values = np.array([-7, -6, 5, 6])
+    np.testing.assert_array_equal(nearest_integer.shift(values, -2), [-2, -1, 1, 2])
+    np.testing.assert_array_equal(floor.shift(values, -2), [-2, -2, 1, 1])
+    np.testing.assert_array_equal(ceil.shift(values, -2), [-1, -1, 2, 2])
+    np.testing.assert_array_equal(truncate.shift(values, -2), [-1, -1, 1, 1])
+
+    assert truncate.shift(-7, -2) == -1
+    assert truncate.shift(5, -2) == 1
+    assert truncate.shift(5, 2) == 20
+    assert type(truncate.shift(5, -2)) is int
+
+
+def test_shift_intervals():
+    value = interval(-7, 5)
+    assert nearest_integer.shift(value, -2) == interval(-2, 1)
+    assert floor.shift(value, -2) == interval(-2, 1)
+    assert ceil.shift(value, -2) == interval(-1, 2)
+    assert truncate.shift(value, -2) == interval(-1, 1)
+
+    value = interval(np.array([-7, -6]), np.array([5, 6]))
+    result = truncate.shift(value, -2)
+    np.testing.assert_array_equal(result.lower_bound, [-1, -1])
+    np.testing.assert_array_equal(result.upper_bound, [1, 1])
+    result = ceil.shift(value, -2)
+    np.testing.assert_array_equal(result.lower_bound, [-1, -1])
+    np.testing.assert_array_equal(result.upper_bound, [2, 2])
+
+
+@pytest.mark.parametrize("method", [floor, ceil, truncate])
+def test_apply_to_floats_returns_integers(method):
+    for x in (-2.5, -0.5, -0.0, 0.0, 0.5, 2.5, 2.0 ** 60):
+        result = method.apply(x)
+        assert type(result) is int
+        assert result == method.apply(mpmath.mpf(x))
+
+
+def test_error_bounds():
+    assert nearest_integer.error_bounds(-2) == interval(-0.125, 0.125)
+    assert nearest_integer.error_bounds(-2, -4) == interval(-0.0625, 0.125)
+    assert floor.error_bounds(2) == interval(-4, 0)
+    assert floor.error_bounds(-2, -4) == interval(-0.1875, 0)
+    assert ceil.error_bounds(0) == interval(0, 1)
+    assert ceil.error_bounds(-2, -4) == interval(0, 0.1875)
+    assert truncate.error_bounds(1) == interval(-2, 2)
+    assert truncate.error_bounds(-2, -4) == interval(-0.1875, 0.1875)
+    assert floor.error_bounds(-2) is floor.error_bounds(-2)
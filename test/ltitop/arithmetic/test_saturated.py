@@ -18,6 +18,8 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with ltitop.  If not, see <http://www.gnu.org/licenses/>.
 
+import numpy as np
+
 from ltitop.arithmetic.interval import interval
 from ltitop.arithmetic.saturated import saturate
 
@@ -58,3 +60,18 @@ def test_saturate():
     value, overflow = saturate(-129, range_=interval(-128, 127))
     assert value == -128
     assert overflow
+
+
+def test_saturate_arrays():
+    values, overflow = saturate(
+        np.array([32, 128, -1, -129]), range_=interval(-128, 127)
+    )
+    np.testing.assert_array_equal(values, [32, 127, -1, -128])
+    np.testing.assert_array_equal(overflow, [False, True, False, True])
+
+    value, overflow = saturate(
+        interval(np.array([0, 100]), np.array([10, 130])), range_=interval(-128, 127)
+    )
+    np.testing.assert_array_equal(value.lower_bound, [0, 100])
+    np.testing.assert_array_equal(value.upper_bound, [10, 127])
+    np.testing.assert_array_equal(overflow, [False, True])
@@ -33,3 +33,47 @@ def test_mixed_symbols():
         a = sympy.sympify(fixed(0.5))
         b = sympy.sympify(error_bounded(0.25))
         assert (a * b).number == fixed(0.125)
+
+
+def test_same_type_symbols():
+    with FixedFormatArithmeticLogicUnit(format_=Q(7), allows_overflow=False):
+        a = sympy.sympify(fixed(0.5))
+        b = sympy.sympify(fixed(0.25))
+        assert float(a + b) == 0.75
+        assert float(a - b) == 0.25
+        assert float(a * b) == 0.125
+        assert b < a
+        assert b <= a
+        assert a == sympy.sympify(fixed(0.5))
+
+
+def test_symbols_with_numeric_operands():
+    with FixedFormatArithmeticLogicUnit(format_=Q(7), allows_overflow=False):
+        a = sympy.sympify(fixed(0.5))
+        assert float(a + 0.25) == 0.75
+        assert float(0.25 + a) == 0.75
+        assert float(a * sympy.Rational(1, 2)) == 0.25
+        assert float(a - sympy.Float(0.25)) == 0.25
+        assert a * 1 is a
+        assert a + 0 is a
+        assert a < 1
+
+
+def test_error_bounded_symbols_with_numeric_operands():
+    a = sympy.sympify(error_bounded(0.25))
+    assert a * 1 is a
+    assert a - 0 is a
+    assert float(a + 1) == 1.25
+    assert float(2 * a) == 0.5
+    assert float(1 - a) == 0.75
+
+
+def test_floor_and_ceiling():
+    for value, floor_value, ceiling_value in [
+        (2.5, 2, 3),
+        (-2.5, -3, -2),
+        (3, 3, 3),
+    ]:
+        a = sympy.sympify(error_bounded(value))
+        assert float(a.floor()) == floor_value
+        assert float(a.ceiling()) == ceiling_value
@@ -39,3 +39,17 @@ def test_annotation():
             return [True]
 
     assert do_something.possible_results() == [True, False]
+
+
+def test_annotation_on_construction():
+    def do_something():
+        return 42
+
+    annotated_do_something = annotated_function(do_something, allows_nothing=False)
+    assert annotated_do_something() == 42
+    assert annotated_do_something.allows_nothing is False
+
+    with pytest.raises(ValueError):
+        annotated_do_something.annotate(allows_nothing=True)
+    with pytest.raises(AttributeError):
+        annotated_do_something.allows_everything
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+# ltitop - A toolkit to describe and optimize LTI systems topology
+# Copyright (C) 2021 Michel Hidalgo <hid.michel@gmail.com>
+#
+# This file is part of ltitop.
+#
+# ltitop is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# ltitop is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with ltitop.  If not, see <http://www.gnu.org/licenses/>.
+
+import mpmath
+import numpy as np
+
+from ltitop.arithmetic.interval import interval
+from ltitop.common.arrays import simple_if_possible, split, vectorize, within
+
+
+def test_simple_if_possible():
+    value = np.array([1e-20, 1.0 + 1e-20j, 1e-20 + 1.0j, 1.0 + 1.0j])
+    result = simple_if_possible(value)
+    assert result is value
+    np.testing.assert_array_equal(result, [0.0, 1.0, 1.0j, 1.0 + 1.0j])
+
+    value = np.array([1e-20, 1.0])
+    result = simple_if_possible(value, copy=True)
+    assert result is not value
+    np.testing.assert_array_equal(result, [0.0, 1.0])
+    np.testing.assert_array_equal(value, [1e-20, 1.0])
+
+    assert simple_if_possible(2.0 + 1e-20j) == 2.0
+    assert simple_if_possible(1e-20 - 2.0j) == -2.0j
+
+
+def test_within():
+    values = np.array([-2.0, 0.0, 0.5, 1.0, 3.0])
+    np.testing.assert_array_equal(
+        within(values, interval(0, 1)), [False, True, True, True, False]
+    )
+    np.testing.assert_array_equal(
+        within(values, {0.5, 3.0}), [False, False, True, False, True]
+    )
+    np.testing.assert_array_equal(
+        within(values, [0.0, 1.0]), [False, True, False, True, False]
+    )
+    assert within(0.5, interval(0, 1)) is True
+    assert within(2.0, {1.0, 2.0}) is True
+    assert within("b", {"a", "b"}) is True
+    assert within(-1, interval(mpmath.ninf, mpmath.inf)) is True
+
+
+def test_split():
+    array = np.arange(6)
+    parts = split(array, [1, 4])
+    assert len(parts) == 3
+    np.testing.assert_array_equal(parts[0], [0])
+    np.testing.assert_array_equal(parts[1], [1, 2, 3])
+    np.testing.assert_array_equal(parts[2], [4, 5])
+
+    parts = split(array, [])
+    assert len(parts) == 1
+    np.testing.assert_array_equal(parts[0], array)
+
+    groups = [(1,), (2, 3), (), (4, 5, 6)]
+    assert split(groups, [1, 3]) == [[(1,)], [(2, 3), ()], [(4, 5, 6)]]
+    assert split(groups, []) == [groups]
+
+
+def test_vectorize():
+    @vectorize
+    def add(a, b):
+        return a + b
+
+    assert add(1, 2) == 3
+    assert type(add(1, 2)) is int
+    np.testing.assert_array_equal(add(np.array([1, 2]), 1), [2, 3])
+
+    @vectorize
+    def divmod_(a, b):
+        return divmod(a, b)
+
+    assert divmod_(7, 2) == (3, 1)
+    quotients, remainders = divmod_(np.array([7, 8]), 2)
+    np.testing.assert_array_equal(quotients, [3, 4])
+    np.testing.assert_array_equal(remainders, [1, 0])
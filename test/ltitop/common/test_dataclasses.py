@@ -18,6 +18,7 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with ltitop.  If not, see <http://www.gnu.org/licenses/>.
 
+import copy
 from dataclasses import FrozenInstanceError
 
 import pytest
@@ -40,3 +41,38 @@ def test_immutable_dataclass():
 
     with pytest.raises(FrozenInstanceError):
         data.b = "bar"
+
+
+def test_immutable_dataclass_slots():
+    @immutable_dataclass
+    class Base:
+        a: int
+
+        def __post_init__(self):
+            super().__setattr__("a", self.a * 2)
+
+        def describe(self):
+            return "base"
+
+    @immutable_dataclass
+    class Derived(Base):
+        b: str = "foo"
+
+        def describe(self):
+            return "derived from " + super().describe()
+
+    data = Derived(1)
+    assert not hasattr(data, "__dict__")
+    assert isinstance(data, Base)
+    assert data.a == 2
+    assert data.b == "foo"
+    assert data.describe() == "derived from base"
+    assert Derived.__mro__ == (Derived, Base, object)
+
+    with pytest.raises(FrozenInstanceError):
+        data.a = 2
+
+    with pytest.raises(FrozenInstanceError):
+        data.c = 3
+
+    assert copy.deepcopy(data) == data
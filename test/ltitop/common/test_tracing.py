@@ -57,3 +57,20 @@ def test_traceable_inside_tracing_scope():
             (SimpleTraceable.do_once, True, (1, 2), {"foo": "bar"}),
             (SimpleTraceable.do_twice, True, (3.0, True), {"fizz": "buzz"}),
         ]
+
+
+def test_traceable_inside_nested_tracing_scopes():
+    obj = SimpleTraceable()
+    with obj.trace() as outer_trace:
+        obj.do_once(1)
+        with obj.trace() as inner_trace:
+            obj.do_once(2)
+        obj.do_once(3)
+    obj.do_once(4)
+    assert outer_trace == [
+        (SimpleTraceable.do_once, True, (1,), {}),
+        (SimpleTraceable.do_once, True, (2,), {}),
+        (SimpleTraceable.do_once, True, (3,), {}),
+    ]
+    assert inner_trace == [(SimpleTraceable.do_once, True, (2,), {})]
+    assert not obj._traces
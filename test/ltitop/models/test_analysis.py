@@ -18,11 +18,17 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with ltitop.  If not, see <http://www.gnu.org/licenses/>.
 
+import os
+
+import mpmath
+import numpy as np
+import pytest
 import scipy.signal as signal
-from numpy.testing import assert_almost_equal
+from numpy.testing import assert_allclose, assert_almost_equal
 
 from ltitop.arithmetic.interval import interval
 from ltitop.models.analysis import (
+    WCPG_ABCD,
     dc_gain,
     is_stable,
     output_range,
@@ -40,6 +46,19 @@ def test_model_stability():
     assert_almost_equal(spectral_radius(model), 0.5)
 
 
+def test_model_stability_across_representations():
+    model = signal.dlti([1], [1, -0.5, 0.06])
+    expected_radius = 0.3
+    for other in (model, model.to_zpk(), model.to_ss()):
+        assert is_stable(other)
+        assert_almost_equal(spectral_radius(other), expected_radius)
+    model = signal.dlti([1], [1, -2.5, 1])
+    expected_radius = 2
+    for other in (model, model.to_zpk(), model.to_ss()):
+        assert not is_stable(other)
+        assert_almost_equal(spectral_radius(other), expected_radius)
+
+
 def test_model_dc_gain():
     assert dc_gain(signal.dlti([0.75, 0], [1, -0.5])) == 1.5
 
@@ -53,3 +72,129 @@ def test_model_output_range():
     model = signal.dlti([0.75, 0], [1, -0.5])
     input_range = interval(-1, 1)
     assert output_range(model, input_range) == interval(-1.5, 1.5)
+
+
+def test_model_worst_case_peak_gain_by_impulse_response():
+    for order, cutoff in [(2, 0.5), (4, 0.2), (6, 0.1)]:
+        A, B, C, D = signal.zpk2ss(*signal.butter(order, cutoff, output="zpk"))
+        expected_wcpg = np.abs(D)
+        Ap = np.eye(A.shape[0])
+        for _ in range(5000):
+            expected_wcpg = expected_wcpg + np.abs(C @ Ap @ B)
+            Ap = Ap @ A
+        assert_allclose(WCPG_ABCD(A, B, C, D), expected_wcpg, rtol=1e-12)
+
+    # MIMO system with complex poles
+    A = np.array([[0.5, -0.5], [0.5, 0.5]])
+    B = np.eye(2)
+    C = np.array([[1.0, 0.0], [1.0, -1.0]])
+    D = np.array([[0.0, 1.0], [-1.0, 0.0]])
+    expected_wcpg = np.abs(D)
+    Ap = np.eye(2)
+    for _ in range(200):
+        expected_wcpg = expected_wcpg + np.abs(C @ Ap @ B)
+        Ap = Ap @ A
+    assert_allclose(WCPG_ABCD(A, B, C, D), expected_wcpg, rtol=1e-12)
+
+    # Defective system matrix
+    A = np.array([[0.5, 1.0], [0.0, 0.5]])
+    B = np.array([[0.0], [1.0]])
+    C = np.array([[1.0, 0.0]])
+    D = np.array([[0.0]])
+    # h[n] = n 0.5^(n - 1) -> WCPG = 1 / (1 - 0.5)^2 = 4
+    assert_allclose(WCPG_ABCD(A, B, C, D), [[4.0]], rtol=1e-6)
+
+
+def test_model_analysis_memoization():
+    num, den = np.array([0.75, 0]), np.array([1, -0.5])
+    worst_case_peak_gain.cache_clear()
+    assert worst_case_peak_gain((num, den)) == 1.5
+    assert worst_case_peak_gain((num.copy(), den.copy())) == 1.5
+    assert worst_case_peak_gain(signal.dlti(num, den)) == 1.5
+    assert worst_case_peak_gain((num, den * 2)) == 0.75
+    assert dc_gain((num, den)) == 1.5
+    assert is_stable((num, den))
+    input_range = interval(np.array([-1.0]), np.array([1.0]))
+    assert output_range((num, den), input_range) == interval(-1.5, 1.5)
+
+
+def test_model_worst_case_peak_gain_persistent_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("LTITOP_WCPG_CACHE_DIR", str(tmp_path))
+    model = signal.dlti([0.75, 0], [1, -0.5])
+    worst_case_peak_gain.cache_clear()
+    assert worst_case_peak_gain(model) == 1.5
+    (cache_file,) = tmp_path.iterdir()
+    np.save(cache_file, np.array([[3.0]]))  # tamper to check cache use
+    worst_case_peak_gain.cache_clear()
+    assert worst_case_peak_gain(model) == 3.0
+    worst_case_peak_gain.cache_clear()
+
+
+def test_model_worst_case_peak_gain_persistent_cache_failure(tmp_path, monkeypatch):
+    monkeypatch.setenv("LTITOP_WCPG_CACHE_DIR", str(tmp_path))
+
+    def failing_replace(src, dst):
+        raise OSError("no space left on device")
+
+    monkeypatch.setattr(os, "replace", failing_replace)
+    model = signal.dlti([0.75, 0], [1, -0.5])
+    worst_case_peak_gain.cache_clear()
+    with pytest.warns(RuntimeWarning, match="Could not cache"):
+        assert worst_case_peak_gain(model) == 1.5
+    assert not list(tmp_path.iterdir())
+    worst_case_peak_gain.cache_clear()
+
+
+def test_model_gains_across_representations():
+    num, den = [0.75, 0], [1, -0.5]
+    A, B, C, D = signal.tf2ss(num, den)
+    for model in ((num, den), signal.dlti(num, den), signal.dlti(num, den).to_zpk()):
+        assert_almost_equal(dc_gain(model), 1.5)
+    for model in ((num, den), signal.dlti(num, den)):
+        assert_almost_equal(worst_case_peak_gain(model), 1.5)
+    for model in ((A, B, C, D), signal.dlti(A, B, C, D)):
+        assert_almost_equal(dc_gain(model), [[1.5]])
+        assert_almost_equal(worst_case_peak_gain(model), [[1.5]])
+
+
+def test_model_output_range_for_constant_input():
+    model = signal.dlti([0.75, 0], [1, -0.5])
+    assert output_range(model, interval(2, 2)) == interval(3, 3)
+
+    model = signal.dlti([1], [1, -2], dt=1)
+    with pytest.raises(ValueError, match="diverges"):
+        output_range(model, interval(1, 1))
+    with pytest.raises(ValueError, match="diverges"):
+        output_range(model, interval(0, 1))
+
+
+def test_model_stability_by_denominator():
+    rng = np.random.default_rng(0)
+    for _ in range(100):
+        poles = rng.uniform(0.1, 1.2, size=4) * np.exp(
+            1j * rng.uniform(0, np.pi, size=4)
+        )
+        poles = np.concatenate([poles, np.conj(poles)])
+        den = np.real(np.poly(poles))
+        expected = bool(np.all(np.abs(poles) < 1))
+        assert bool(is_stable(([1], den))) is expected
+        assert bool(is_stable(signal.dlti([1], den))) is expected
+        assert bool(is_stable(signal.dlti([1], den).to_zpk())) is expected
+
+
+def test_model_analysis_memoization_with_object_arrays():
+    # temporaries are dropped on every iteration so that
+    # freed objects' addresses get reused
+    model = signal.dlti([0.75, 0], [1, -0.5])
+    for i in range(1, 50):
+        assert output_range(
+            model,
+            interval(
+                np.array([-mpmath.mpf(i)], dtype=object),
+                np.array([mpmath.mpf(i)], dtype=object),
+            ),
+        ) == interval(-1.5 * i, 1.5 * i)
+        assert (
+            dc_gain((np.array([mpmath.mpf(i), 0], dtype=object), np.array([1, -0.5])))
+            == 2 * i
+        )
@@ -27,6 +27,7 @@ from ltitop.models.composites import (
     series_composition,
     series_decomposition,
 )
+from ltitop.models.transforms import as_zpk
 
 
 def test_series_composition():
@@ -72,3 +73,22 @@ def test_parallel_decomposition():
     _, Hl = left.freqresp(w=w)
     _, Hr = right.freqresp(w=w)
     assert_almost_equal(Hp, Hl + Hr)
+
+
+def test_repeated_decomposition():
+    series = signal.lti([1, 0], [1, 1.5, 1, 0.25])
+    w, Hs = series.freqresp()
+    for _ in range(2):
+        head, tail = series_decomposition(series, 2)
+        _, He = head.freqresp(w=w)
+        _, Ht = tail.freqresp(w=w)
+        assert_almost_equal(Hs, He * Ht)
+
+
+def test_as_zpk():
+    model = signal.dlti([0.75, 0], [1, -0.5])
+    zpk_model = as_zpk(model)
+    assert isinstance(zpk_model, signal.ZerosPolesGain)
+    assert as_zpk(model) is zpk_model
+    assert as_zpk(zpk_model) is zpk_model
+    assert as_zpk(signal.dlti([0], [1, -0.5])).gain == 0
@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+
+# ltitop - A toolkit to describe and optimize LTI systems topology
+# Copyright (C) 2021 Michel Hidalgo <hid.michel@gmail.com>
+#
+# This file is part of ltitop.
+#
+# ltitop is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# ltitop is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with ltitop.  If not, see <http://www.gnu.org/licenses/>.
+
+import itertools
+import random
+
+import numpy as np
+import pytest
+import scipy.signal as signal
+
+from ltitop.topology.realizations.direct_forms import DirectFormI
+
+pytest.importorskip("deap")
+
+import deap.gp  # noqa: E402
+import deap.tools  # noqa: E402
+
+import ltitop.solvers.gp as gp  # noqa: E402
+
+
+def size_of(realize, model):
+    try:
+        return (float(realize(model).size()),)
+    except ValueError:
+        return None
+
+
+@pytest.fixture
+def toolbox():
+    prototype = signal.dlti(*signal.butter(4, 0.2, output="zpk"))
+    return gp.formulate(
+        prototype,
+        transforms=[],
+        evaluate=size_of,
+        weights=(-1.0,),
+        forms=[DirectFormI],
+        variants=[0],
+        tol=1e-6,
+    )
+
+
+def test_evaluation_workers(toolbox):
+    population = toolbox.population(16)
+    expected_fitnesses = toolbox.batch_evaluate(population)
+    map_, batch_evaluate = toolbox.map, toolbox.batch_evaluate
+    with gp.evaluation_workers(toolbox, max_workers=2) as workers:
+        assert workers is toolbox
+        assert toolbox.map is not map_
+        assert toolbox.batch_evaluate(population) == expected_fitnesses
+    assert toolbox.map is map_
+    assert toolbox.batch_evaluate is batch_evaluate
+
+
+def test_compile(toolbox):
+    prototype = signal.dlti(*signal.butter(4, 0.2, output="zpk"))
+    for code in toolbox.population(32):
+        expected_size = size_of(deap.gp.compile(code, toolbox.pset), prototype)
+        assert size_of(toolbox.compile(code), prototype) == expected_size
+
+
+class CountingToolbox:
+    def __init__(self, fitnesses):
+        self.fitnesses = fitnesses
+        self.evaluated = []
+
+    def batch_evaluate(self, codes):
+        self.evaluated.extend(str(code) for code in codes)
+        return [self.fitnesses[str(code)] for code in codes]
+
+
+def test_evaluate_with_cache(toolbox):
+    population = toolbox.population(32)
+    population += [toolbox.clone(ind) for ind in population]
+    codes = sorted({str(ind) for ind in population})
+    fitnesses = {
+        code: None if i % 3 == 0 else (float(i),) for i, code in enumerate(codes)
+    }
+    counting_toolbox = CountingToolbox(fitnesses)
+    cache = {}
+
+    unfeasible, nevals = gp._evaluate_with_cache(population, counting_toolbox, cache)
+    assert nevals == len(codes)
+    assert sorted(counting_toolbox.evaluated) == codes
+    assert cache == fitnesses
+    assert [id(ind) for ind in unfeasible] == [
+        id(ind) for ind in population if fitnesses[str(ind)] is None
+    ]
+    for ind in population:
+        if fitnesses[str(ind)] is not None:
+            assert ind.fitness.values == fitnesses[str(ind)]
+
+    # Cached fitnesses, unfeasible ones included, are never evaluated again
+    population = [toolbox.clone(ind) for ind in population]
+    for ind in population:
+        del ind.fitness.values
+    unfeasible, nevals = gp._evaluate_with_cache(population, counting_toolbox, cache)
+    assert nevals == 0
+    assert len(counting_toolbox.evaluated) == len(codes)
+    assert len(unfeasible) == sum(fitnesses[str(ind)] is None for ind in population)
+
+
+def individuals_with(toolbox, scores, weights):
+    individuals = []
+    for values in scores:
+        ind = gp.Code(toolbox.code(), weights)
+        ind.fitness.values = tuple(values)
+        individuals.append(ind)
+    return individuals
+
+
+@pytest.mark.parametrize("weights", [(-1.0, 1.0), (1.0, 1.0, -1.0)])
+def test_update_halloffame(toolbox, weights):
+    rng = random.Random(0)
+    expected_halloffame = deap.tools.ParetoFront()
+    halloffame = deap.tools.ParetoFront()
+    for _ in range(10):
+        # Use few distinct values to get plenty of ties
+        scores = [
+            [rng.randint(0, 4) for _ in weights] for _ in range(rng.randint(0, 20))
+        ]
+        population = individuals_with(toolbox, scores, weights)
+        expected_halloffame.update(population)
+        gp._update_halloffame(halloffame, population)
+        # Hall of fame keeps copies, so compare contents
+        assert [(str(ind), ind.fitness.values) for ind in halloffame] == [
+            (str(ind), ind.fitness.values) for ind in expected_halloffame
+        ]
+
+
+def reference_argnondominated(*scores):
+    dominated = []
+    scores = np.array(scores, dtype=object).T
+    for i in range(len(scores) - 1):
+        if i in dominated:
+            continue
+        for j in range(i + 1, len(scores)):
+            if all(scores[i] >= scores[j]):
+                dominated.append(j)
+            elif all(scores[j] >= scores[i]):
+                dominated.append(i)
+                break
+    return [k for k in range(len(scores)) if k not in dominated]
+
+
+def test_argnondominated_ties():
+    assert gp.argnondominated([1, 1, 0], [0, 0, 1]) == [0, 2]
+    assert gp.argnondominated([1, 1, 1], [1, 1, 1], [1, 1, 1]) == [0]
+    assert gp.argnondominated([1, 2, 2], [2, 1, 1]) == [0, 1]
+
+
+@pytest.mark.parametrize(
+    "n_scores, size, block_size",
+    itertools.product([1, 2, 3], [0, 1, 2, 50], [4, 256]),
+)
+def test_argnondominated(n_scores, size, block_size):
+    rng = np.random.default_rng(n_scores * size)
+    for _ in range(10):
+        # Use few distinct values to get plenty of ties
+        scores = rng.integers(0, 5, size=(n_scores, size)).tolist()
+        assert gp.argnondominated(
+            *scores, block_size=block_size
+        ) == reference_argnondominated(*scores)
@@ -80,3 +80,19 @@ def test_parallel_diagram_construction():
     assert len(diagram[x][y]) == 2
     assert diagram[x][y][0]["block"] is left_block
     assert diagram[x][y][1]["block"] is right_block
+
+
+def test_repeated_diagram_simplification():
+    null_block = DirectFormI.from_model(signal.dlti(0, [1, -0.5]))
+    unit_block = DirectFormI.from_model(signal.dlti(1, 1))
+    block = DirectFormI.from_model(signal.dlti(2, [1, -0.5]))
+    x, y = sympy.symbols("x y")
+
+    for _ in range(2):
+        diagram = series_diagram([unit_block, block], input_=x, output=y)
+        assert len(diagram[x][y]) == 1
+        assert diagram[x][y][0]["block"] is block
+
+        diagram = parallel_diagram([null_block, block], input_=x, output=y)
+        assert len(diagram[x][y]) == 1
+        assert diagram[x][y][0]["block"] is block
@@ -20,6 +20,7 @@
 
 import itertools
 
+import numpy as np
 import pytest
 import scipy.signal as signal
 from numpy.testing import assert_allclose
@@ -30,6 +31,7 @@ from ltitop.arithmetic.fixed_point.fixed_format_arithmetic_logic_unit import (
 from ltitop.arithmetic.fixed_point.formats import Q
 from ltitop.arithmetic.interval import interval
 from ltitop.arithmetic.rounding import nearest_integer
+from ltitop.topology.realizations import Realization
 from ltitop.topology.realizations.direct_forms import (
     DirectFormI,
     DirectFormII,
@@ -74,3 +76,24 @@ def test_realization_error_bounds(realization_type):
         ) in 10 * nearest_integer.error_bounds(
             -7
         )  # reasonable tolerance
+
+
+@pytest.mark.parametrize(
+    "model",
+    [
+        signal.dlti([1, 0], [1, -0.5]),
+        signal.dlti([1], [1, 2, 1]),
+        signal.dlti([1, 2, 1], [1, 0, 0]),
+    ],
+)
+def test_direct_form_ii_float_processing(model):
+    block = DirectFormII.from_model(model)
+    inputs = np.linspace(-1, 1, 50)
+    initial_states = [np.linspace(0.5, -0.5, block.states[0][0])]
+    states, outputs = block.process(inputs, initial_states)
+    # compare against sample by sample processing
+    expected_states, expected_outputs = Realization.process(
+        block, np.c_[inputs], initial_states
+    )
+    assert_allclose(states, np.asarray(expected_states, dtype=float))
+    assert_allclose(outputs, np.asarray(expected_outputs, dtype=float))